@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
 import euklid
@@ -53,6 +54,12 @@ class RibHoleBase(BaseModel):
 
     def get_centers(self, rib: Rib, scale: bool=False) -> list[euklid.vector.Vector2D]:
         raise NotImplementedError()
+
+    def get_perimeter(self, rib: Rib) -> float:
+        """
+        Estimated perimeter of the largest curve (relative to the chord), without sampling
+        """
+        raise NotImplementedError()
     
     def get_3d(self, rib: Rib, num: int=20) -> list[euklid.vector.PolyLine3D]:
         hole = self.get_curves(rib, num=num)
@@ -111,6 +118,12 @@ class RibHole(RibHoleBase):
         diff = upper - lower
         
         return diff.length() * self.size.si
+
+    def get_perimeter(self, rib: Rib) -> float:
+        a = self.get_diameter(rib) / 2
+        b = a * self.width.si
+        # ramanujan's approximation
+        return math.pi * (3*(a+b) - math.sqrt((3*a+b)*(a+3*b)))
     
     def get_centers(self, rib: Rib, scale: bool=False) -> list[euklid.vector.Vector2D]:
         return [self._get_points(rib)[0]]
@@ -164,6 +177,10 @@ class PolygonHole(RibHoleBase):
         
         return centers
 
+    def get_perimeter(self, rib: Rib) -> float:
+        # rounded corners are shorter than the control polygon
+        return euklid.vector.PolyLine2D(self.points + self.points[:1]).get_length()
+
     def _get_curves(self, rib: Rib, num: int=160) -> list[euklid.vector.PolyLine2D]:
         return [polygon(self.points, self.corner_size, num)]
 
@@ -191,14 +208,14 @@ class RibSquareHole(RibHoleBase):
         
         return centers
     
-    def _get_curves(self, rib: Rib, num: int=80) -> list[euklid.vector.PolyLine2D]:
+    def _get_polygon(self, rib: Rib) -> PolygonHole | None:
         width = rib.convert_to_percentage(self.width)
         x1 = self.x - width/2
         x2 = self.x + width/2
 
         xmin, xmax = self.get_envelope_boundaries(rib)
         if x1 < xmin or x2 > xmax:
-            return []
+            return None
         
         p1, p2, p3, p4 = self.align_contolpoints([
             euklid.vector.Vector2D([x1, -self.height]),
@@ -207,7 +224,21 @@ class RibSquareHole(RibHoleBase):
             euklid.vector.Vector2D([x1, self.height])
         ], rib)
 
-        return PolygonHole(points=[p1, p2, p3, p4]).get_curves(rib, num)
+        return PolygonHole(points=[p1, p2, p3, p4])
+
+    def get_perimeter(self, rib: Rib) -> float:
+        square = self._get_polygon(rib)
+        if square is None:
+            return 0.
+
+        return square.get_perimeter(rib)
+    
+    def _get_curves(self, rib: Rib, num: int=80) -> list[euklid.vector.PolyLine2D]:
+        square = self._get_polygon(rib)
+        if square is None:
+            return []
+
+        return square.get_curves(rib, num)
 
 
 class MultiSquareHole(RibHoleBase):
@@ -252,6 +283,9 @@ class MultiSquareHole(RibHoleBase):
             holes += hole.get_centers(rib, scale=scale)
         
         return holes
+
+    def get_perimeter(self, rib: Rib) -> float:
+        return max([hole.get_perimeter(rib) for hole in self._get_holes(rib)], default=0.)
     
     def _get_curves(self, rib: Rib, num: int=80) -> list[euklid.vector.PolyLine2D]:
         curves = []
@@ -449,6 +483,10 @@ class AttachmentPointHole(RibHoleBase):
 
         return holes
 
+    def get_perimeter(self, rib: Rib) -> float:
+        holes = self._get_holes_bottom(rib) + self._get_holes_top(rib)
+        return max([hole.get_perimeter(rib) for hole in holes], default=0.)
+
     def _get_curves(self, rib: Rib, num: int=80) -> list[euklid.vector.PolyLine2D]:
         curves = []
         for hole in self._get_holes_bottom(rib):
@@ -5,6 +5,7 @@ import math
 from typing import TYPE_CHECKING, TypeAlias
 
 import euklid
+import numpy as np
 from openglider.vector.drawing import Layout, PlotPart
 from openglider.vector.unit import Percentage
 
@@ -93,12 +94,13 @@ class Shape:
 
     @property
     def area(self) -> float:
-        front, back = self.front, self.back
-        area = 0.
-        for i in range(len(self.front) - 1):
-            l = (front.get(i)[1] - back.get(i)[1]) + (front.get(i+1)[1] - back.get(i+1)[1])
-            area += l * (front.get(i+1)[0] - front.get(i)[0]) / 2
-        return area
+        # trapezoids between neighbouring ribs
+        front = np.array(self.front.tolist())
+        back = np.array(self.back.tolist())
+        chord = front[:, 1] - back[:, 1]
+        widths = np.diff(front[:, 0])
+
+        return float(np.dot(chord[:-1] + chord[1:], widths) / 2)
     
     @area.setter
     def area(self, area: float) -> None:
@@ -123,7 +123,7 @@ class QTaskQueue(QtWidgets.QWidget):
         self.list.addItem(list_entry)
         self.list.setItemWidget(list_entry, list_entry.widget)
 
-        self.queue.tasks.append(task)
+        self.queue.add(task)
         # self.app.show_tab(self)
 
     async def _update(self) -> None:
@@ -537,15 +537,12 @@ class Mesh:
             replacement.attributes.update(node.attributes)
 
         for boundary_name, boundary_nodes in self.boundary_nodes.items():
-            to_remove = []
-            for i, node in enumerate(boundary_nodes):
-                if node in replace_dict:
-                    to_remove.append(i)
-            for i in to_remove[::-1]:
-                boundary_nodes.pop(i)
+            remaining_nodes = [node for node in boundary_nodes if node not in replace_dict]
+            count = len(boundary_nodes) - len(remaining_nodes)
+            # keep the list object, it might be shared with other meshes
+            boundary_nodes[:] = remaining_nodes
 
-            if to_remove:
-                count = len(to_remove)
+            if count:
                 logger.info(f"deleted {count} duplicated Vertices for boundary group <{boundary_name}> ")
 
         for polygon in self.get_all_polygons():
@@ -561,7 +558,7 @@ class Mesh:
                 new_polygon.attributes = polygon.attributes
                 self.polygons[group_name][i] = new_polygon
 
-        vertices = self.vertices
+        vertices = set(self.vertices)
         for boundary_name in _boundaries:
             for i, node in enumerate(self.boundary_nodes[boundary_name]):
                 if node not in vertices:
@@ -47,6 +47,10 @@ class PatternConfigOld(Config):
     rib_text_in_seam = False
     rib_text_pos = 0.015
 
+    rib_hole_segment_length = 0.002 # m
+    rib_hole_numpoints_min = 32
+    rib_hole_numpoints_max = 200
+
     drib_text_position = 0.1
 
     insert_attachment_point_text = True
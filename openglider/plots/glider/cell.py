@@ -291,10 +291,12 @@ class PanelPlot:
 
     def _insert_controlpoints(self, plotpart: PlotPart) -> None:
         # insert chord-wise controlpoints
-        for x in self.config.get_controlpoints(self.cell.rib1):
-            self.insert_mark(self.config.marks_controlpoint, x, plotpart, False)
-        for x in self.config.get_controlpoints(self.cell.rib2):
-            self.insert_mark(self.config.marks_controlpoint, x, plotpart, True)
+        marks_controlpoint = self.config.marks_controlpoint
+        if marks_controlpoint is not None:
+            for x in self.config.get_controlpoints(self.cell.rib1):
+                self.insert_mark(marks_controlpoint, x, plotpart, False)
+            for x in self.config.get_controlpoints(self.cell.rib2):
+                self.insert_mark(marks_controlpoint, x, plotpart, True)
         
         # insert horizontal (spanwise) controlpoints
         x_dots = 2
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import heapq
 import math
 from typing import TYPE_CHECKING
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 import euklid
+import numpy as np
 from openglider import logging
 from openglider.airfoil import get_x_value
 from openglider.glider.cell.diagonals import DiagonalSide
@@ -21,10 +23,13 @@ from openglider.vector.unit import Length, Percentage
 
 if TYPE_CHECKING:
     from openglider.glider.rib import Rib
+    from openglider.glider.rib.crossports import RibHoleBase
     from openglider.glider import Glider
+    from openglider.glider.cell import Cell
 
 
 Vector2D = euklid.vector.Vector2D
+MarkFunction = Callable[[Vector2D, Vector2D], dict[str, list[euklid.vector.PolyLine2D]]]
 
 logger = logging.getLogger(__name__)
 
@@ -53,10 +58,13 @@ class RigidFoilPlot:
         # back cap
         p1 = self.inner_curve.nodes[position]
         p2 = self.outer_curve.nodes[position]
-        angle = math.pi/2
+        d = p1 - p2
+        # rotate by +-90deg
         if rear:
-            angle = -angle
-        diff = euklid.vector.Rotation2D(angle).apply(p1-p2).normalized() * self.rigidfoil.cap_length.si
+            normal = Vector2D([d[1], -d[0]])
+        else:
+            normal = Vector2D([-d[1], d[0]])
+        diff = normal.normalized() * self.rigidfoil.cap_length.si
 
         return (
             (p1, p2),
@@ -82,40 +90,57 @@ class RigidFoilPlot:
     def flatten(self, glider: Glider) -> PlotPart:
         plotpart = PlotPart()
 
+        ribplot = self.ribplot
+        layer_name_marks = ribplot.layer_name_marks
+        layer_name_laser_dots = ribplot.layer_name_laser_dots
+
         controlpoints: list[tuple[float, list[euklid.vector.PolyLine2D]]] = []
-        for x in self.ribplot.config.get_controlpoints(self.ribplot.rib):
-            for mark in self.ribplot.insert_mark(x, self.ribplot.config.marks_controlpoint, insert=False):
+        marks_controlpoint = ribplot.config.marks_controlpoint
+        for x in ribplot.config.get_controlpoints(ribplot.rib):
+            for mark in ribplot.insert_mark(x, marks_controlpoint, insert=False):
                 controlpoints.append((x, mark))
 
-        curve = self.rigidfoil.get_flattened(self.ribplot.rib, glider)
+        curve = self.rigidfoil.get_flattened(ribplot.rib, glider)
 
         # add marks into the profile
-        self.ribplot.plotpart.layers[self.ribplot.layer_name_rigidfoils].append(curve)
-        self.ribplot.plotpart.layers[self.ribplot.layer_name_laser_dots].append(euklid.vector.PolyLine2D([curve.get(0)]))
-        self.ribplot.plotpart.layers[self.ribplot.layer_name_laser_dots].append(euklid.vector.PolyLine2D([curve.get(len(curve)-1)]))
+        rib_layers = ribplot.plotpart.layers
+        rib_layers[ribplot.layer_name_rigidfoils].append(curve)
+        rib_layers[layer_name_laser_dots].append(euklid.vector.PolyLine2D([curve.get(0)]))
+        rib_layers[layer_name_laser_dots].append(euklid.vector.PolyLine2D([curve.get(len(curve)-1)]))
 
         self.inner_curve, self.outer_curve = self._get_inner_outer(glider)
 
-        plotpart.layers[self.ribplot.layer_name_marks].append(curve)
+        plotpart.layers[layer_name_marks].append(curve)
 
         back_cap = self.get_cap(-1, True)
-        plotpart.layers[self.ribplot.layer_name_marks].append(euklid.vector.PolyLine2D(list(back_cap[0])))
+        plotpart.layers[layer_name_marks].append(euklid.vector.PolyLine2D(list(back_cap[0])))
 
         front_cap = self.get_cap(0, False)
-        plotpart.layers[self.ribplot.layer_name_marks].append(euklid.vector.PolyLine2D(list(front_cap[0])))
+        plotpart.layers[layer_name_marks].append(euklid.vector.PolyLine2D(list(front_cap[0])))
         
-        outline = self.inner_curve
-        outline += euklid.vector.PolyLine2D(list(back_cap[1]))
-        outline += self.outer_curve.reverse()
-        outline += euklid.vector.PolyLine2D(list(front_cap[1])).reverse()
+        outline = euklid.vector.PolyLine2D(
+            self.inner_curve.nodes +
+            list(back_cap[1]) +
+            self.outer_curve.nodes[::-1] +
+            list(front_cap[1])[::-1]
+        )
+
+        rigidfoil_start = self.rigidfoil.start
+        rigidfoil_end = self.rigidfoil.end
+
+        # bounding box to skip most of the (expensive) contains checks
+        outline_xy = np.asarray(outline.tolist())
+        x_min, y_min = outline_xy.min(axis=0)
+        x_max, y_max = outline_xy.max(axis=0)
 
         for x, controlpoint in controlpoints:
             p = controlpoint[0].nodes[0]
-            fits_x = self.rigidfoil.start < x and x < self.rigidfoil.end
-            if fits_x or outline.contains(p):
-                plotpart.layers[self.ribplot.layer_name_laser_dots] += controlpoint
+            fits_x = rigidfoil_start < x and x < rigidfoil_end
+            in_bbox = x_min <= p[0] <= x_max and y_min <= p[1] <= y_max
+            if fits_x or (in_bbox and outline.contains(p)):
+                plotpart.layers[layer_name_laser_dots] += controlpoint
                 
-        plotpart.layers[self.ribplot.layer_name_outline].append(outline.fix_errors().close())
+        plotpart.layers[ribplot.layer_name_outline].append(outline.fix_errors().close())
 
         self.add_text(plotpart)
 
@@ -142,6 +167,9 @@ class RibPlot:
     layer_name_laser_dots = "L0"
     layer_name_crossports = "cuts"
 
+    # panel cut positions are compared after rounding to this many digits
+    panel_cut_digits = 9
+
     def __init__(self, rib: Rib, config: Config | None=None):
         self.rib = rib
         self.config = self.DefaultConf(config)
@@ -162,87 +190,80 @@ class RibPlot:
                     (panel.cut_front.x_right, panel.cut_back.x_right) for panel in cell.panels
                 ])
         
+        # sweep over all panels ordered by their front cut (k-way merge of
+        # the sorted per-cell lists) and collect the gaps between them
+        for cell_panels in panels:
+            cell_panels.sort(key=lambda panel: panel[0].si)
+
         result: list[tuple[Percentage, Percentage]] = []
         last_cut = Percentage(-1)
-        current_indices = [0] * len(panels)
-
-        while True:
-            # go through all panels and check for gaps
-            gap_end = None
-
-            while gap_end is None:
-                for cell_index in range(len(panels)):
-                    while current_indices[cell_index] < len(panels[cell_index]):
-                        panel_index = current_indices[cell_index]
-                        panel = panels[cell_index][panel_index]
-
-                        if panel[0] > last_cut:
-                            # we have a gap => update gap and break the inner loop
-                            if gap_end is None:
-                                gap_end = panel[0]
-                                break
-                            elif gap_end < panel[0]:
-                                gap_end = panel[0]
-                                break
-                        else:
-                            # no gap => reset
-                            gap_end = None
-                            last_cut = max(last_cut, panel[1])
-                        
-                        current_indices[cell_index] += 1
-
-                # break the loop when we are at the end
-                if all([current_indices[i] >= len(panels[i]) for i in range(len(panels))]):
-                    break
-            
-            if gap_end is not None:
-                result.append((last_cut, gap_end))
-                last_cut = gap_end
 
-            # break the loop when we are at the end
-            if all([current_indices[i] >= len(panels[i]) for i in range(len(panels))]):
-                break
+        for front, back in heapq.merge(*panels, key=lambda panel: panel[0].si):
+            if front > last_cut:
+                result.append((last_cut, front))
+                last_cut = back
+            else:
+                last_cut = max(last_cut, back)
             
         if last_cut < Percentage(1):
             result.append((last_cut, Percentage(1)))
 
         return result
     
-    def get_panel_cuts(self, glider: Glider) -> list[tuple[Percentage, bool]]:
-        cuts_entry = self._get_panel_cuts(glider, True)
-        cuts_all = self._get_panel_cuts(glider, False)
+    def _get_cells(self, glider: Glider) -> list[tuple[Cell, bool]]:
+        """
+        Cells attached to the rib, paired with a flag whether the rib is the left one (rib1) of the cell
+        """
+        cells: list[tuple[Cell, bool]] = []
 
-        cuts_design = set(cuts_all) - set(cuts_entry)
+        for cell in glider.cells:
+            if cell.rib1 == self.rib:
+                cells.append((cell, True))
+            elif cell.rib2 == self.rib:
+                cells.append((cell, False))
         
-        all_cuts_with_type = [(x, True) for x in cuts_entry] + [(x, False) for x in cuts_design]
-        all_cuts_with_type.sort(key=lambda x: x[0])
+        return cells
+    
+    def get_panel_cuts(self, glider: Glider) -> list[tuple[Percentage, bool]]:
+        cells = self._get_cells(glider)
+        # both lists are rounded the same way, so the set operations can compare exactly
+        cuts_entry = np.unique(self._get_panel_cuts(cells, True))
+        cuts_all = np.unique(self._get_panel_cuts(cells, False))
 
-        return all_cuts_with_type
+        cuts_design = np.setdiff1d(cuts_all, cuts_entry, assume_unique=True)
 
+        cuts = np.concatenate([cuts_entry, cuts_design])
+        is_entry = np.concatenate([np.ones(len(cuts_entry), dtype=bool), np.zeros(len(cuts_design), dtype=bool)])
+        order = np.argsort(cuts, kind="stable")
 
+        return [
+            (Percentage(x), entry)
+            for x, entry in zip(cuts[order].tolist(), is_entry[order].tolist())
+        ]
 
-    def _get_panel_cuts(self, glider: Glider, connected: bool) -> list[Percentage]:
-        panel_cuts: set[Percentage] = set()
 
-        for cell in glider.cells:
-            if self.rib not in cell.ribs:
-                continue
 
+    def _get_panel_cuts(self, cells: list[tuple[Cell, bool]], connected: bool) -> list[float]:
+        """
+        x-values of the panel cuts, rounded to panel_cut_digits (cuts closer than that are the same cut)
+        """
+        panel_cuts: set[float] = set()
+
+        for cell, is_left in cells:
             if not connected:
                 panels = cell.panels
             else:
                 panels = cell.get_connected_panels()
 
-            if cell.rib1 == self.rib:
-                # panel-cuts
-                for panel in panels:
-                    panel_cuts.add(panel.cut_front.x_left)
-                    panel_cuts.add(panel.cut_back.x_left)
-            
-            elif cell.rib2 == self.rib:
-                for panel in panels:
-                    panel_cuts.add(panel.cut_front.x_right)
-                    panel_cuts.add(panel.cut_back.x_right)
+            for panel in panels:
+                if is_left:
+                    # panel-cuts
+                    cuts = (panel.cut_front.x_left, panel.cut_back.x_left)
+                else:
+                    cuts = (panel.cut_front.x_right, panel.cut_back.x_right)
+
+                for cut in cuts:
+                    panel_cuts.add(round(cut.si, self.panel_cut_digits))
             
         return list(panel_cuts)
 
@@ -255,29 +276,43 @@ class RibPlot:
         self.x_values = prof2d.x_values
         self.inner = prof2d.curve.scale(self.rib.chord)
         self.inner_normals = self.inner.normvectors()
+        # keep the non-simple offset: it removes self-intersections at concave
+        # parts and is hardly slower than inner + normals * seam_allowance
         self.outer = self.inner.offset(self.rib.seam_allowance.si, simple=False)
 
+        # contiguous copies for interpolation in _get_inner_outer
+        self._inner_xy = np.asarray(self.inner.tolist())
+        self._normal_xy = np.asarray(self.inner_normals.tolist())
+        self._x_values_np = np.asarray(self.x_values)
+        self._ik_cache: dict[float, float] = {}
+
         self._insert_attachment_points(glider)
-        holes = self.insert_holes()
+        _holes, holes_area = self.insert_holes()
 
-        for cell in glider.cells:
-            if self.rib not in cell.ribs:
-                continue
+        get_drib_marks = self._get_drib_marks
+        drib_marks: list[tuple[float | Percentage, MarkFunction]] = []
 
-            if cell.rib1 == self.rib:
+        for cell, is_left in self._get_cells(glider):
+            if is_left:
                 for diagonal in cell.diagonals + cell.straps:
-                    self.insert_drib_mark(diagonal.side1)
+                    drib_marks += get_drib_marks(diagonal.side1)
 
-            elif cell.rib2 == self.rib:
+            else:
                 for diagonal in cell.diagonals + cell.straps:  # type: ignore
-                    self.insert_drib_mark(diagonal.side2)
+                    drib_marks += get_drib_marks(diagonal.side2)
+
+        self.insert_marks(drib_marks)
+
+        marks_panel_cut = self.config.marks_panel_cut
+        insert_design_cuts = self.config.insert_design_cuts
+        layer_name_outline = self.layer_name_outline
 
         for cut, is_entry in self.get_panel_cuts(glider):
             if -0.99 < cut.si and cut.si < 0.99:
                 if is_entry:
-                    self.insert_mark(cut, self.config.marks_panel_cut, force_layer_name=self.layer_name_outline)
-                elif self.config.insert_design_cuts:
-                    self.insert_mark(cut, self.config.marks_panel_cut)
+                    self.insert_mark(cut, marks_panel_cut, force_layer_name=layer_name_outline)
+                elif insert_design_cuts:
+                    self.insert_mark(cut, marks_panel_cut)
 
         self._insert_text()
         self.insert_controlpoints()
@@ -285,9 +320,7 @@ class RibPlot:
         # insert cut
         envelope = self.draw_outline(glider)
 
-        area = envelope.get_area()
-        for hole in holes:
-            area -= hole.get_area()
+        area = envelope.get_area() - holes_area
 
         self.weight = MaterialUsage().consume(self.rib.material, area)
 
@@ -301,31 +334,79 @@ class RibPlot:
 
         return self.plotpart
 
+    def _get_ik(self, x_value: Percentage | float) -> float:
+        """
+        get_x_value for the current rib, memoized as the same positions are
+        used by panels, diagonals, straps,...
+        """
+        x = float(x_value)
+        ik = self._ik_cache.get(x)
+
+        if ik is None:
+            ik = get_x_value(self.x_values, x)
+            self._ik_cache[x] = ik
+
+        return ik
+
     def _get_inner_outer(self, x_value: Percentage | float) -> tuple[euklid.vector.Vector2D, euklid.vector.Vector2D]:
-        ik = get_x_value(self.x_values, x_value)
+        ik = self._get_ik(x_value)
+
+        # same linear inter-/extrapolation as PolyLine2D.get(ik)
+        i0 = min(max(int(ik), 0), len(self._inner_xy) - 2)
+        frac = ik - i0
+
+        inner = (1-frac) * self._inner_xy[i0] + frac * self._inner_xy[i0+1]
+        normal = (1-frac) * self._normal_xy[i0] + frac * self._normal_xy[i0+1]
+        outer = inner + normal * self.rib.seam_allowance.si
+
+        return Vector2D(inner.tolist()), Vector2D(outer.tolist())
 
-        inner = self.inner.get(ik)
-        outer = inner + self.inner_normals.get(ik) * self.rib.seam_allowance.si
+    def _get_inner_outer_batch(self, x_values: Sequence[float | Percentage]) -> list[tuple[euklid.vector.Vector2D, euklid.vector.Vector2D]]:
+        """
+        Vectorized version of _get_inner_outer for a list of positions
+        """
+        xs = np.asarray([float(x) for x in x_values])
+        x_ref = self._x_values_np
+
+        i0 = np.clip(np.searchsorted(x_ref, xs) - 1, 0, len(x_ref) - 2)
+        frac = ((xs - x_ref[i0]) / (x_ref[i0+1] - x_ref[i0]))[:, None]
 
-        return inner, outer
+        inner = (1-frac) * self._inner_xy[i0] + frac * self._inner_xy[i0+1]
+        normal = (1-frac) * self._normal_xy[i0] + frac * self._normal_xy[i0+1]
+        outer = inner + normal * self.rib.seam_allowance.si
+
+        return [
+            (Vector2D(p_inner), Vector2D(p_outer))
+            for p_inner, p_outer in zip(inner.tolist(), outer.tolist())
+        ]
 
     def insert_mark(
         self,
         position: float | Percentage,
-        mark_function: Callable[[euklid.vector.Vector2D, euklid.vector.Vector2D], dict[str, list[euklid.vector.PolyLine2D]]],
+        mark_function: MarkFunction,
         insert: bool=True,
         force_layer_name: str | None = None
         ) -> list[list[euklid.vector.PolyLine2D]]:
-
-        marks = []
-        #if mark_function_func := getattr(mark_function, "__func__", None):
-        #    mark_function = mark_function_func
-
+        # marks are Mark instances stored on the config instance, so they
+        # arrive here as plain callables (no bound methods to unwrap)
         if mark_function is None:
             return
 
         inner, outer = self._get_inner_outer(position)
 
+        return self._insert_mark_at(inner, outer, mark_function, insert, force_layer_name)
+
+    def _insert_mark_at(
+        self,
+        inner: euklid.vector.Vector2D,
+        outer: euklid.vector.Vector2D,
+        mark_function: MarkFunction,
+        insert: bool=True,
+        force_layer_name: str | None = None
+        ) -> list[list[euklid.vector.PolyLine2D]]:
+
+        marks = []
+
         for mark_layer, mark in mark_function(inner, outer).items():
             if insert:
                 if force_layer_name:
@@ -336,16 +417,37 @@ class RibPlot:
         
         return marks
 
+    def insert_marks(self, marks: Sequence[tuple[float | Percentage, MarkFunction | None]]) -> None:
+        """
+        Insert multiple (position, mark_function) marks with one batched interpolation
+        """
+        marks_to_insert = [
+            (position, mark_function) for position, mark_function in marks if mark_function is not None
+        ]
+        points = self._get_inner_outer_batch([position for position, _ in marks_to_insert])
+
+        # collect the lines per layer and add them to the plotpart in one go
+        layers: dict[str, list[euklid.vector.PolyLine2D]] = {}
+
+        for (inner, outer), (_, mark_function) in zip(points, marks_to_insert):
+            for mark_layer, mark in mark_function(inner, outer).items():
+                layers.setdefault(mark_layer, []).extend(mark)
+
+        for layer_name, lines in layers.items():
+            self.plotpart.layers[layer_name] += lines
+
     def insert_controlpoints(self, controlpoints: list[float]=None) -> None:
         if controlpoints is None:
             controlpoints = list(self.config.get_controlpoints(self.rib))
 
-        x_end = None
+        x_values = np.asarray(controlpoints, dtype=float)
+
         if self.rib.trailing_edge_extra is not None and self.rib.trailing_edge_extra.si < 0:
             x_end = 1. + self.rib.convert_to_percentage(self.rib.trailing_edge_extra).si
-        for x in controlpoints:
-            if x_end is None or abs(x) <= x_end:
-                self.insert_mark(x, self.config.marks_controlpoint)
+            x_values = x_values[np.abs(x_values) <= x_end]
+
+        mark_function = self.config.marks_controlpoint
+        self.insert_marks([(x, mark_function) for x in x_values.tolist()])
 
     def get_point(self, x: float | Percentage, y: float=-1.) -> euklid.vector.Vector2D:
         x = float(x)
@@ -353,30 +455,62 @@ class RibPlot:
         p = self.rib.profile_2d.profilepoint(x, y)
         return p * self.rib.chord
 
-    def insert_drib_mark(self, side: DiagonalSide) -> None:        
+    def insert_drib_mark(self, side: DiagonalSide) -> None:
+        self.insert_marks(self._get_drib_marks(side))
+
+    def _get_drib_marks(self, side: DiagonalSide) -> list[tuple[float | Percentage, MarkFunction]]:
+        """
+        Get the marks for a diagonal side on the profile. Marks of sides
+        that are not on the profile are inserted directly.
+        """
         if side.is_lower:
-            return  # disabled
-            self.insert_mark(side.start_x, self.config.marks_diagonal_front)
-            self.insert_mark(side.end_x, self.config.marks_diagonal_back)
+            return []  # disabled
         elif side.is_upper:
-            self.insert_mark(side.start_x(self.rib), self.config.marks_diagonal_back)
-            self.insert_mark(side.end_x(self.rib), self.config.marks_diagonal_front)
+            return [
+                (side.start_x(self.rib), self.config.marks_diagonal_back),
+                (side.end_x(self.rib), self.config.marks_diagonal_front)
+            ]
         else:
             p1 = self.get_point(side.start_x(self.rib), side.height)
             p2 = self.get_point(side.end_x(self.rib), side.height)
             self.plotpart.layers[self.layer_name_marks].append(euklid.vector.PolyLine2D([p1, p2]))
 
-    def insert_holes(self) -> list[euklid.vector.PolyLine2D]:
+            return []
+
+    def _get_hole_numpoints(self, hole: RibHoleBase) -> int:
+        """
+        Sample holes by size: one point per rib_hole_segment_length of the (estimated) perimeter
+        """
+        num_min = self.config.rib_hole_numpoints_min
+        num_max = self.config.rib_hole_numpoints_max
+
+        try:
+            perimeter = hole.get_perimeter(self.rib) * self.rib.chord
+        except NotImplementedError:
+            return num_max
+
+        num = int(perimeter / self.config.rib_hole_segment_length)
+
+        return max(num_min, min(num_max, num))
+
+    def insert_holes(self) -> tuple[list[euklid.vector.PolyLine2D], float]:
+        """
+        Add the crossport cuts to the plotpart and return them along with their summed area
+        """
         holes: list[PlotPart] = []
-        for hole in self.rib.holes:            
-            holes.append(hole.get_flattened(self.rib, num=200, layer_name=self.layer_name_crossports))
+        for hole in self.rib.holes:
+            num = self._get_hole_numpoints(hole)
+            holes.append(hole.get_flattened(self.rib, num=num, layer_name=self.layer_name_crossports))
         
         curves: list[euklid.vector.PolyLine2D] = []
+        area = 0.
         for plotpart in holes:
             self.plotpart += plotpart
-            curves += list(plotpart.layers["cuts"])
+            for curve in plotpart.layers["cuts"]:
+                curves.append(curve)
+                area += curve.get_area()
 
-        return curves
+        return curves, area
 
     def draw_outline(self, glider: Glider) -> euklid.vector.PolyLine2D:
         """
@@ -384,10 +518,10 @@ class RibPlot:
         """
         if self.rib.trailing_edge_extra is not None and self.rib.trailing_edge_extra.si < 0.:
             x = 1. + self.rib.convert_to_percentage(self.rib.trailing_edge_extra).si
-            start = get_x_value(self.x_values, -x)
+            start = self._get_ik(-x)
             inner_start = start
 
-            stop = get_x_value(self.x_values, x)
+            stop = self._get_ik(x)
             inner_end = stop
 
             trailing_edge = [
@@ -426,8 +560,8 @@ class RibPlot:
         seams: list[tuple[float, float]] = []
         seam_last_x = inner_start
         for x1, x2 in panel_free_zones:
-            ik1 = get_x_value(self.x_values, x1)
-            ik2 = get_x_value(self.x_values, x2)
+            ik1 = self._get_ik(x1)
+            ik2 = self._get_ik(x2)
 
             seams.append((seam_last_x, ik1))
             seam_last_x = ik2
@@ -446,8 +580,8 @@ class RibPlot:
                 x1 = max(self.rib.sharknose.start, x1)
                 x2 = min(self.rib.sharknose.end, x2)
                 
-                sharknose_start = get_x_value(self.x_values, x1)
-                sharknose_end = get_x_value(self.x_values, x2)
+                sharknose_start = self._get_ik(x1)
+                sharknose_end = self._get_ik(x2)
 
                 line1 = self.outer.get(start, sharknose_start).nodes
                 line2 = self.outer.get(sharknose_end, stop).nodes
@@ -481,18 +615,21 @@ class RibPlot:
         return outline
 
     def walk(self, x: float, amount: float) -> float:
-        ik = get_x_value(self.x_values, x)
+        ik = self._get_ik(x)
 
         ik_new = self.inner.walk(ik, amount)
 
         return self.inner.get(ik_new)[0]/self.rib.chord
 
     def _insert_attachment_points(self, glider: Glider) -> None:
+        mark_function = self.config.marks_attachment_point
+        marks: list[tuple[float | Percentage, MarkFunction]] = []
+
         for attachment_point in self.rib.attachment_points:
-            positions = attachment_point.get_x_values(self.rib)
+            for position in attachment_point.get_x_values(self.rib):
+                marks.append((position, mark_function))
 
-            for position in positions:
-                self.insert_mark(position, self.config.marks_attachment_point)
+        self.insert_marks(marks)
 
     def _insert_text(self) -> None:
         text = f"p{self.rib.name}"
@@ -501,9 +638,10 @@ class RibPlot:
             diff = outer - inner
 
             p1 = inner + diff * 0.5
-            p2 = p1 + euklid.vector.Rotation2D(-math.pi/2).apply(diff)
+            # diff rotated by -90 degrees
+            p2 = p1 + euklid.vector.Vector2D([diff[1], -diff[0]])
 
-            _text = Text(text, p1, p2, size=(outer-inner).length()*0.5, valign=0)
+            _text = Text(text, p1, p2, size=diff.length()*0.5, valign=0)
             #_text = Text(text, p1, p2, size=0.05)
         else:
             p1 = self.get_point(self.config.rib_text_pos, -1)
@@ -545,6 +683,12 @@ class SingleSkinRibPlot(RibPlot):
             p1 = hull.curve.get(ik) * self.rib.chord
             p2 = p1 + normal * self.rib.seam_allowance.si
             return p1, p2
+
+    def _get_inner_outer_batch(self, x_values: Sequence[float | Percentage]) -> list[tuple[euklid.vector.Vector2D, euklid.vector.Vector2D]]:
+        if self.skin_cut is None or all(float(x) < self.skin_cut.si for x in x_values):
+            return super()._get_inner_outer_batch(x_values)
+
+        return [self._get_inner_outer(x) for x in x_values]
         
     def insert_controlpoints(self, controlpoints: list[float]=None) -> None:
         if self.skin_cut is not None:
@@ -595,28 +739,30 @@ class SingleSkinRibPlot(RibPlot):
 
         start = cuts[0][0]
 
-        contour = euklid.vector.PolyLine2D([])
-
         # outer is going from the back back until the singleskin cut
 
         singleskin_cut_left = self._get_singleskin_cut(glider)
         single_skin_cut = self.rib.profile_2d(singleskin_cut_left)
 
         if self.rib.trailing_edge_extra is not None:
-            buerzl = euklid.vector.PolyLine2D([
+            buerzl = [
                 inner_rib.get(0),
                 inner_rib.get(0) + euklid.vector.Vector2D([self.rib.trailing_edge_extra.si, 0]),
                 outer_rib.get(start) + euklid.vector.Vector2D([self.rib.trailing_edge_extra.si, 0]),
                 outer_rib.get(start)
-                ])
+                ]
         else:
-            buerzl = euklid.vector.PolyLine2D([
+            buerzl = [
                 inner_rib.get(0),
                 outer_rib.get(start)
-            ])
-        contour += outer_rib.get(start, single_skin_cut)
-        contour += inner_rib.get(single_skin_cut, len(inner_rib)-1)
-        contour += buerzl
+            ]
+
+        # splice the nodes and build the contour once
+        contour = euklid.vector.PolyLine2D(
+            outer_rib.get(start, single_skin_cut).nodes +
+            inner_rib.get(single_skin_cut, len(inner_rib)-1).nodes +
+            buerzl
+        )
 
         self.plotpart.layers[self.layer_name_outline].append(contour)
         self.plotpart.layers[self.layer_name_sewing].append(self.inner)
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree
+
+import euklid
+
+from openglider.vector.drawing import Layout, PlotPart
+
+
+class TestLayout(unittest.TestCase):
+    def get_part(self, width: float, height: float) -> PlotPart:
+        part = PlotPart()
+        part.layers["cuts"].append(euklid.vector.PolyLine2D([[0, 0], [width, 0], [width, height], [0, height], [0, 0]]))
+        return part
+
+    def test_stack_column_empty_part(self) -> None:
+        part = self.get_part(2, 1)
+        column = Layout.stack_column([PlotPart(), part, Layout([PlotPart()])], 0.1)
+
+        self.assertAlmostEqual(column.width, 2)
+        self.assertAlmostEqual(part.min_x, 0)
+        self.assertAlmostEqual(part.min_y, 0.1)
+
+    def test_stack_row_empty_part(self) -> None:
+        part = self.get_part(2, 1)
+        row = Layout.stack_row([PlotPart(), part], 0.1)
+
+        self.assertAlmostEqual(row.height, 1)
+        self.assertAlmostEqual(part.min_x, 0)
+        self.assertAlmostEqual(part.min_y, 0)
+
+    def test_export_svg_style_block(self) -> None:
+        part = self.get_part(2, 1)
+        part.material_code = "skytex #FF0000"
+        part.layers["marks"]  # empty layer
+        part.layers["my layer"].append(euklid.vector.PolyLine2D([[0, 0], [1, 1]]))
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            path = os.path.join(tempdir, "layout.svg")
+            Layout([part]).export_svg(path, inline_styles=False, fill=True)
+            root = xml.etree.ElementTree.parse(path).getroot()
+
+        namespace = "{http://www.w3.org/2000/svg}"
+        style = "".join(element.text or "" for element in root.iter(f"{namespace}style"))
+        polylines = {element.attrib["class"].split(" ")[0]: element for element in root.iter(f"{namespace}polyline")}
+
+        self.assertIn(".cuts {", style)
+        self.assertIn("stroke: red;", style)
+        # no rules for empty layers or layers that aren't a single class
+        self.assertNotIn(".marks", style)
+        self.assertNotIn("my layer", style)
+        self.assertEqual(style.count("{"), 1)
+
+        self.assertEqual(polylines["cuts"].attrib["style"], "fill: #FF0000")
+        self.assertNotIn("stroke", polylines["cuts"].attrib)
+
+        # falls back to inline attributes
+        self.assertEqual(polylines["my"].attrib["fill"], "#FF0000")
+        self.assertEqual(polylines["my"].attrib["stroke"], "black")
+
+
+if __name__ == "__main__":
+    unittest.main()
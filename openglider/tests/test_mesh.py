@@ -20,8 +20,9 @@ class TestMesh(GliderTestCase):
         m2 = Mesh({"b": [b]}, boundary_nodes={"j": list(b)})
         m3 = m1 + m2
         m3.delete_duplicates()
+        vertices = m3.vertices
         for vertex in a:
-            matches = [vertex.is_equal(p) for p in m3.vertices]
+            matches = [vertex.is_equal(p) for p in vertices]
             self.assertTrue(any(matches))
 
     def test_glider_mesh(self) -> None:
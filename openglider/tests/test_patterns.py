@@ -5,7 +5,10 @@ import os
 import openglider
 import openglider.plots
 import openglider.plots.glider
-from openglider.vector.drawing import Layout
+from openglider.glider.rib.crossports import RibHole
+from openglider.plots.config import PatternConfig
+from openglider.plots.glider.ribs import RibPlot
+from openglider.vector.drawing import Layout, PlotPart
 from openglider.tests.common import GliderTestCase
 
 
@@ -33,5 +36,22 @@ class TestPlots(GliderTestCase):
         dwg = Layout.stack_row(self.plotmaker.ribs, 0.1)
         dwg.export_dxf(os.path.join(TEMPDIR, "test_ribs.dxf"))
 
+    def test_rib_hole_numpoints(self) -> None:
+        rib, hole = next((rib, hole) for rib in self.glider.ribs for hole in rib.holes if isinstance(hole, RibHole))
+        rib.holes = [hole]
+        perimeter = hole.get_perimeter(rib) * rib.chord
+
+        def get_numpoints(**config: float) -> int:
+            rib_plot = RibPlot(rib, config=PatternConfig(config))
+            rib_plot.plotpart = PlotPart()
+            curves, _ = rib_plot.insert_holes()
+            self.assertEqual(len(curves), 1)
+            return len(curves[0])
+
+        segment_length = perimeter / 50.5
+        self.assertEqual(get_numpoints(rib_hole_segment_length=segment_length), 50)
+        self.assertEqual(get_numpoints(rib_hole_segment_length=segment_length, rib_hole_numpoints_min=80), 80)
+        self.assertEqual(get_numpoints(rib_hole_segment_length=segment_length, rib_hole_numpoints_min=10, rib_hole_numpoints_max=20), 20)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,135 @@
+import unittest
+
+from openglider.utils.table import Table
+
+
+class TestTable(unittest.TestCase):
+    def get_table(self) -> Table:
+        table = Table()
+        table["A1"] = "name"
+        table["B1"] = 1.5
+        table["A2"] = "x"
+        table["C2"] = 2
+
+        return table
+
+    def test_keys(self) -> None:
+        table = self.get_table()
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.num_columns, 3)
+        self.assertEqual(table["B1"], 1.5)
+        self.assertEqual(table["b1"], 1.5)
+        self.assertEqual(table[1, 2], 2)
+        self.assertEqual(table.get(2, 1), 2)
+        self.assertIsNone(table["B2"])
+        self.assertEqual(Table.str_decrypt("AB12"), (27, 11))
+        self.assertEqual(Table.str_encrypt(27, 11), "AB12")
+
+        with self.assertRaises(ValueError):
+            Table.str_decrypt("AB")
+
+    def test_append_right(self) -> None:
+        table = self.get_table()
+        other = Table()
+        other["A1"] = "right"
+        other["B3"] = 3
+
+        table.append_right(other, space=1)
+
+        self.assertEqual(table["E1"], "right")
+        self.assertEqual(table["F3"], 3)
+        self.assertIsNone(table["D1"])
+        self.assertEqual(table.num_columns, 6)
+        self.assertEqual(table.num_rows, 3)
+
+    def test_append_bottom(self) -> None:
+        table = self.get_table()
+        other = Table()
+        other["A1"] = "bottom"
+        other["D2"] = 4
+
+        table.append_bottom(other, space=2)
+
+        self.assertEqual(table["A5"], "bottom")
+        self.assertEqual(table["D6"], 4)
+        self.assertEqual(table.num_columns, 4)
+        self.assertEqual(table.num_rows, 6)
+
+    def test_sub(self) -> None:
+        table = self.get_table()
+        other = Table()
+        other["B1"] = 0.5
+        other["A2"] = "y"
+        other["D1"] = 1
+
+        result = table - other
+
+        self.assertEqual(result["B1"], 1.0)
+        self.assertEqual(result["A2"], "x - y")
+        self.assertEqual(result["D1"], -1)
+        self.assertEqual(result["C2"], 2)
+        # the original stays untouched
+        self.assertEqual(table["B1"], 1.5)
+        self.assertIsNone(table["D1"])
+
+        table -= other
+        self.assertEqual(table.dct, result.dct)
+
+    def test_copy(self) -> None:
+        table = self.get_table()
+        table["D1"] = [1]
+        cpy = table.copy()
+        cpy["A1"] = "changed"
+        cpy["D1"].append(2)
+
+        self.assertEqual(table["A1"], "name")
+        self.assertEqual(table["D1"], [1])
+        self.assertEqual((cpy.num_rows, cpy.num_columns), (2, 4))
+
+    def test_get_rows_columns(self) -> None:
+        table = self.get_table()
+
+        rows = table.get_rows(1, None)
+        self.assertEqual(rows.num_rows, 1)
+        self.assertEqual(rows["A1"], "x")
+        self.assertEqual(rows["C1"], 2)
+        self.assertIsNone(rows["B1"])
+
+        columns = table.get_columns(1, 3)
+        self.assertEqual(columns.num_columns, 2)
+        self.assertEqual(columns["A1"], 1.5)
+        self.assertEqual(columns["B2"], 2)
+        self.assertIsNone(columns["A2"])
+
+    def test_markdown(self) -> None:
+        table = self.get_table()
+
+        self.assertEqual(table.get_markdown_table(), (
+            "| name | 1.5000 |   |\n"
+            "|    x |        | 2 |\n"
+        ))
+
+    def test_html(self) -> None:
+        table = self.get_table()
+
+        self.assertEqual(table._repr_html_(), (
+            "<table><thead><td></td><td>A</td><td>B</td><td>C</td></thead>"
+            "<tr><td>1</td><td>name</td><td>1.5</td><td></td></tr>"
+            "<tr><td>2</td><td>x</td><td></td><td>2</td></tr>"
+            "</table>"
+        ))
+
+    def test_json(self) -> None:
+        table = self.get_table()
+        data = table.__json__()
+
+        self.assertEqual(data, {"dct": {"A1": "name", "B1": 1.5, "A2": "x", "C2": 2}})
+
+        table_2 = Table.__from_json__(**data)
+        self.assertEqual(table_2.dct, table.dct)
+        self.assertEqual((table_2.num_rows, table_2.num_columns), (2, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
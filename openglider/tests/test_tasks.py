@@ -0,0 +1,137 @@
+import asyncio
+import os
+import unittest
+import unittest.mock
+from collections.abc import Callable
+
+from openglider.utils.tasks import Task, TaskQueue
+
+
+class SleepTask(Task):
+    duration = 0.01
+
+    async def run(self) -> None:
+        await asyncio.sleep(self.duration)
+
+
+class BlockingTask(Task):
+    def __init__(self, name: str=None) -> None:
+        super().__init__(name)
+        self.release = asyncio.Event()
+
+    async def run(self) -> None:
+        await self.release.wait()
+
+
+class FailingTask(Task):
+    async def run(self) -> None:
+        raise ValueError("failed")
+
+
+async def wait_until(condition: Callable[[], bool], timeout: float=1) -> None:
+    async def poll() -> None:
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestTaskQueue(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.queue = TaskQueue()
+        # let process() go idle
+        await asyncio.sleep(0.01)
+
+    async def asyncTearDown(self) -> None:
+        self.queue.running = False
+        await asyncio.wait_for(self.queue.process_task, 1)
+        self.queue.pool.shutdown()
+
+    async def test_add(self) -> None:
+        task = SleepTask("a")
+        self.queue.add(task)
+        await wait_until(lambda: task.finished)
+
+    async def test_children(self) -> None:
+        parent = SleepTask("parent")
+        child = SleepTask("child")
+        child.parent = parent
+        self.queue.add(child)
+        self.queue.add(parent)
+        await wait_until(lambda: child.finished)
+
+        self.assertTrue(parent.finished)
+
+    async def test_children_dont_wait(self) -> None:
+        blocking = BlockingTask("blocking")
+        parent = SleepTask("parent")
+        child = SleepTask("child")
+        child.parent = parent
+        self.queue.add(blocking)
+        self.queue.add(child)
+        self.queue.add(parent)
+        await wait_until(lambda: child.finished)
+
+        late = SleepTask("late")
+        self.queue.add(late)
+        await wait_until(lambda: late.finished)
+
+        self.assertFalse(blocking.finished)
+        blocking.release.set()
+        await wait_until(lambda: blocking.finished)
+
+    async def test_failed_parent(self) -> None:
+        parent = FailingTask("parent")
+        child = SleepTask("child")
+        child.parent = parent
+        grandchild = SleepTask("grandchild")
+        grandchild.parent = child
+        # silence the error log
+        self.queue.exception_hook = unittest.mock.Mock()
+        self.queue.add(grandchild)
+        self.queue.add(child)
+        self.queue.add(parent)
+        await wait_until(lambda: grandchild.failed)
+
+        self.assertTrue(parent.failed)
+        self.assertTrue(child.failed)
+        self.assertFalse(grandchild.finished)
+
+    async def test_quit_idle(self) -> None:
+        await self.queue.quit()
+        await asyncio.wait_for(self.queue.process_task, 1)
+
+        self.assertFalse(self.queue.running)
+
+
+class TestQTaskQueue(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        try:
+            from openglider.gui.qt import QtWidgets
+            from openglider.gui.views.tasks import QTaskQueue
+        except ImportError as e:
+            raise unittest.SkipTest(f"gui not available: {e}")
+
+        # openglider.gui defaults to xcb
+        os.environ["QT_QPA_PLATFORM"] = "offscreen"
+        self.qapp = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        self.queue = TaskQueue()
+        self.widget = QTaskQueue(unittest.mock.Mock(), self.queue)
+        await asyncio.sleep(0.01)
+
+    async def asyncTearDown(self) -> None:
+        self.widget.update_task.cancel()
+        await self.queue.quit()
+        await asyncio.wait_for(self.queue.process_task, 1)
+        self.queue.pool.shutdown()
+
+    async def test_append(self) -> None:
+        task = SleepTask("a")
+        self.widget.append(task)
+        await wait_until(lambda: task.finished)
+
+        self.assertEqual(len(self.widget.tasks), 1)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,136 @@
+import copy
+import math
+import pickle
+import unittest
+
+import pydantic
+
+from openglider.vector.unit import Angle, Length, Percentage
+
+
+class ModelWithUnits(pydantic.BaseModel):
+    length: Length
+    percentage: Percentage = Percentage(0.5)
+
+
+class TestQuantity(unittest.TestCase):
+    def test_parse(self) -> None:
+        self.assertEqual(Length("2.5").value, 2.5)
+        self.assertEqual(Length("2.5").display_unit, None)
+        self.assertEqual(Length(" -1e-1 ").value, -0.1)
+        self.assertEqual(Length(".5").value, 0.5)
+
+        for text in ("2.5mm", "2.5 mm", " 2.5mm"):
+            length = Length(text)
+            self.assertAlmostEqual(length.value, 0.0025)
+            self.assertEqual(length.display_unit, "mm")
+
+        self.assertAlmostEqual(Percentage("50%").value, 0.5)
+        self.assertAlmostEqual(Angle("90°").value, math.pi/2)
+        self.assertAlmostEqual(Angle("90deg").value, math.pi/2)
+
+    def test_parse_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            Length("2.5kg")
+
+        with self.assertRaises(ValueError):
+            Length("abc")
+
+    def test_default_display_unit(self) -> None:
+        self.assertEqual(Percentage(0.5).display_unit, "%")
+        self.assertEqual(Angle(1).display_unit, "°")
+        self.assertEqual(Length(1).display_unit, None)
+
+    def test_conversion(self) -> None:
+        length = Length(250, "mm")
+
+        self.assertAlmostEqual(length.si, 0.25)
+        self.assertAlmostEqual(length.get("cm"), 25)
+        self.assertAlmostEqual(length.get(), 0.25)
+        self.assertEqual(str(length), "250.0mm")
+        self.assertEqual(repr(Length(0.25)), "0.25m")
+        self.assertEqual(f"{length:.1f}", "250.0mm")
+        self.assertEqual(repr(Percentage(0.5)), "50.0%")
+
+    def test_arithmetic(self) -> None:
+        a = Length("20mm")
+        b = Length("1cm")
+
+        self.assertAlmostEqual((a + b).value, 0.03)
+        self.assertAlmostEqual((a - b).value, 0.01)
+        self.assertAlmostEqual((a * 2).value, 0.04)
+        self.assertAlmostEqual((2 * a).value, 0.04)
+        self.assertAlmostEqual((a / 2).value, 0.01)
+        self.assertAlmostEqual((-a).value, -0.02)
+        self.assertAlmostEqual(abs(-a), 0.02)
+        self.assertAlmostEqual(float(a), 0.02)
+
+        # results keep the display unit of the left operand if the units agree
+        self.assertEqual((a + a).display_unit, "mm")
+        self.assertEqual((a + b).display_unit, None)
+        self.assertEqual((a * 2).display_unit, "mm")
+        self.assertIsInstance(a + b, Length)
+
+        self.assertTrue(a > b)
+        self.assertTrue(b <= 0.01)
+
+        with self.assertRaises(ValueError):
+            a + Percentage(0.1)
+
+    def test_immutable(self) -> None:
+        length = Length(1)
+
+        with self.assertRaises(AttributeError):
+            length.value = 2  # type: ignore
+
+    def test_equality_and_hash(self) -> None:
+        self.assertEqual(Length("1000mm"), Length(1))
+        self.assertEqual(hash(Length("1000mm")), hash(Length(1)))
+        self.assertEqual(Length(1), 1)
+        self.assertNotEqual(Length(1), Length(2))
+        self.assertNotEqual(Length(1), Percentage(1))
+        self.assertNotEqual(hash(Length(1)), hash(Percentage(1)))
+        self.assertEqual(len({Length(1), Length("100cm"), Length(2)}), 2)
+
+    def test_pickle(self) -> None:
+        for quantity in (Length("2.5mm"), Percentage(0.3), Angle("10°")):
+            for clone in (pickle.loads(pickle.dumps(quantity)), copy.copy(quantity), copy.deepcopy(quantity)):
+                self.assertIs(type(clone), type(quantity))
+                self.assertEqual(clone.value, quantity.value)
+                self.assertEqual(clone.display_unit, quantity.display_unit)
+                self.assertEqual(repr(clone), repr(quantity))
+
+    def test_pydantic(self) -> None:
+        for value in (0.25, "25cm", {"value": 0.25, "display_unit": "cm"}, Length("25cm")):
+            model = ModelWithUnits(length=value)  # type: ignore
+            self.assertIsInstance(model.length, Length)
+            self.assertAlmostEqual(model.length.value, 0.25)
+
+        model = ModelWithUnits(length="25cm")  # type: ignore
+        dumped = model.model_dump()
+        self.assertEqual(dumped["length"], {"value": 0.25, "display_unit": "cm"})
+
+        model_2 = ModelWithUnits.model_validate(dumped)
+        self.assertEqual(model_2, model)
+        self.assertEqual(model_2.length.display_unit, "cm")
+
+        model_3 = ModelWithUnits.model_validate_json(model.model_dump_json())
+        self.assertEqual(model_3, model)
+
+        with self.assertRaises(pydantic.ValidationError):
+            ModelWithUnits(length=Percentage(0.5))  # type: ignore
+
+        with self.assertRaises(pydantic.ValidationError):
+            ModelWithUnits(length=[1])  # type: ignore
+
+    def test_json_schema(self) -> None:
+        schema = ModelWithUnits.model_json_schema()
+        length_schema = schema["properties"]["length"]
+
+        self.assertEqual(length_schema["type"], "object")
+        self.assertEqual(length_schema["required"], ["value"])
+        self.assertEqual(schema["properties"]["percentage"]["properties"]["display_unit"]["default"], "%")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import operator
 from typing import TYPE_CHECKING, Any, TypeVar
 from collections.abc import Callable
 import euklid
@@ -35,6 +36,17 @@ class Config:
     arbitrary_types_allowed = True
     #post_init_call = 'after_validation'
 
+def _get_field_values(fields: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    # attrgetter returns a bare value for a single attribute (and needs at least one)
+    if len(fields) == 0:
+        return lambda instance: ()
+    
+    getter = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda instance: (getter(instance),)
+
+    return getter
+
 @dataclass_transform(kw_only_default=False)
 def dataclass(_cls: type[Any]) -> type[OGDataclassT]:
 
@@ -42,13 +54,14 @@ def dataclass(_cls: type[Any]) -> type[OGDataclassT]:
         _cls_new = dc(_cls)
     else:
         _cls_new = pydantic.dataclasses.dataclass(config=Config, kw_only=False)(_cls)
+
+    _fields = tuple(_cls_new.__dataclass_fields__)
+    _get_values = _get_field_values(_fields)
         
     old_json = getattr(_cls, "__json__", None)
     if old_json is None or getattr(old_json, "is_auto", False):
         def __json__(instance: Any) -> dict[str, Any]:
-            return {
-                key: getattr(instance, key) for key in _cls_new.__dataclass_fields__
-            }
+            return dict(zip(_fields, _get_values(instance)))
         
         setattr(__json__, "is_auto", True)
 
@@ -68,8 +81,7 @@ def dataclass(_cls: type[Any]) -> type[OGDataclassT]:
         # don't shadow hash (internal python name)
         def _hash(instance: Any) -> int:
             try:
-                lst = [getattr(instance, key) for key in _cls_new.__dataclass_fields__]
-                return hash_list(lst)
+                return hash_list(list(_get_values(instance)))
             except Exception as e:
                 raise ValueError(f"invalid elem: {instance}") from e
 
@@ -83,12 +95,20 @@ def dataclass(_cls: type[Any]) -> type[OGDataclassT]:
 
 
 # https://github.com/pydantic/pydantic/issues/501
+_list_types = frozenset((list, tuple))
+
 def get_validator(cls: type) -> Callable[[Any], Any]:
     def validator(v: Any) -> Any:
-        if isinstance(v, (list, tuple)):
+        # exact type checks first, isinstance only for subclasses
+        value_type = type(v)
+        if value_type is cls:
+            return v
+        if value_type in _list_types:
             return cls(v)
         if isinstance(v, cls):
             return v
+        if isinstance(v, (list, tuple)):
+            return cls(v)
         raise ValueError(f"Cannot convert value to Vector3D: {v}")
     
     return validator
@@ -98,6 +118,8 @@ def get_validator(cls: type) -> Callable[[Any], Any]:
 #    (euklid.vector.Vector2D, [get_validator(euklid.vector.Vector2D)])
 #]
 
+_missing = object()
+
 class BaseModel(pydantic.BaseModel):
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
@@ -106,13 +128,30 @@ class BaseModel(pydantic.BaseModel):
         )
     
     def __eq__(self, other: Any) -> bool:
-        return other.__class__ == self.__class__ and self.__dict__ == other.__dict__
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return False
+        
+        own_values = self.__dict__
+        other_values = other.__dict__
+        if len(own_values) != len(other_values):
+            return False
+        
+        for key, value in own_values.items():
+            other_value = other_values.get(key, _missing)
+            # shared sub-objects are skipped without a deep compare
+            if other_value is not value and not (other_value == value):
+                return False
+        
+        return True
 
     def __json__(self) -> dict[str, Any]:
         return dict(self._iter())
 
     def __hash__(self) -> int:
-        return hash_list(*self.dict().values())
+        # hash the field values directly instead of serializing the whole tree with dict()
+        return hash_list(*[getattr(self, key) for key in self.__class__.model_fields])
     
     @model_validator(mode="before")
     @classmethod
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import copy
-import re
+import functools
 from typing import Any, Union
 
 try:
@@ -14,33 +14,40 @@ import ezodf
 CellIndex = Union[tuple[int, int], str]
 
 class Table:
-    rex = re.compile(r"([A-Z]*)([0-9]*)")
     format_float_digits = 4
     name: str=""
 
-    dct: dict[str, Any]
+    # cells by (column_no, row_no)
+    dct: dict[tuple[int, int], Any]
 
     @classmethod
+    @functools.lru_cache(maxsize=65536)
     def str_decrypt(cls, str: str) -> tuple[int, int]:
-        result = cls.rex.match(str.upper())
-        if result:
-            column, row = result.groups()
-            column_no = 0
-            for i, character in enumerate(column[::-1]):
-                column_no += (26**i)*(ord(character)-64)
+        name = str.upper()
+        column_no = 0
+        i = 0
 
-            row_no = int(row)
+        while i < len(name) and "A" <= name[i] <= "Z":
+            column_no = column_no*26 + ord(name[i]) - 64
+            i += 1
 
-            return column_no-1, row_no-1
+        row_start = i
+        while i < len(name) and "0" <= name[i] <= "9":
+            i += 1
 
-        raise ValueError
+        if i == row_start:
+            raise ValueError(f"invalid cell name: {str}")
+
+        return column_no-1, int(name[row_start:i])-1
 
     @classmethod
+    @functools.lru_cache(maxsize=65536)
     def str_encrypt(cls, column: int, row: int) -> str:
 
         return cls.column_to_char(column + 1) + str(row + 1)
 
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def column_to_char(cls, x: int) -> str:
         base = 26
         out = ""
@@ -58,16 +65,18 @@ class Table:
     
     def __json__(self) -> dict[str, Any]:
         return {
-            "dct": self.dct
+            "dct": {
+                self.str_encrypt(column, row): value for (column, row), value in self.dct.items()
+            }
         }
     
     @classmethod
     def __from_json__(cls, dct: dict[str, Any]) -> Table:
         table = cls()
-        table.dct = dct
 
-        for key in dct:
+        for key, value in dct.items():
             column, row = cls.str_decrypt(key)
+            table.dct[column, row] = value
 
             table.num_rows = max(table.num_rows, row+1)
             table.num_columns = max(table.num_columns, column+1)
@@ -85,18 +94,17 @@ class Table:
     def __getitem__(self, item: CellIndex) -> Any:
         if isinstance(item, tuple):
             row_no, column_no = item
-            item = self.str_encrypt(column_no, row_no)
-        return self.dct.get(item, None)
+        else:
+            column_no, row_no = self.str_decrypt(item)
+        return self.dct.get((column_no, row_no), None)
 
     def get_columns(self, from_i: int, to_j: int | None) -> Table:
         if to_j is None:
             to_j = self.num_columns
         new_table = self.__class__(self.num_rows, to_j-from_i)
-        for i in range(from_i, to_j):
-            for row in range(self.num_rows):
-                item = self.str_encrypt(i, row)
-                if item in self.dct:
-                    new_table.set_value(i-from_i, row, self.dct[item])
+        for (column, row), value in self.dct.items():
+            if from_i <= column < to_j:
+                new_table.set_value(column-from_i, row, value)
         
         return new_table
     
@@ -106,48 +114,48 @@ class Table:
         row_count = to_row - from_row
         new_table = Table(row_count, self.num_columns, name=self.name)
 
-        for i in range(from_row, to_row):
-            for column in range(self.num_columns):
-                item = self.str_encrypt(column, i)
-                if item in self.dct:
-                    new_table.set_value(column, i-from_row, self.dct[item])
+        for (column, row), value in self.dct.items():
+            if from_row <= row < to_row:
+                new_table.set_value(column, row-from_row, value)
         
         return new_table
 
     def __isub__(self, other: Table) -> Table:
         import numbers
-        for key in other.dct:
-            zwei = other[key]
+        missing = object()
 
-            if key in self.dct:
-                eins = self[key]
-            else:
-                if isinstance(zwei, numbers.Number):
-                    eins = 0
-                else:
-                    eins = ""
+        for key, zwei in other.dct.items():
+            zwei_is_number = isinstance(zwei, numbers.Number)
+            eins = self.dct.get(key, missing)
 
-            if isinstance(eins, numbers.Number) and isinstance(zwei, numbers.Number):
-                self[key] = eins - zwei  # type: ignore
+            if eins is missing:
+                eins = 0 if zwei_is_number else ""
+
+            if zwei_is_number and isinstance(eins, numbers.Number):
+                self.set_value(*key, eins - zwei)  # type: ignore
             else:
-                self[key] = str(eins) + " - " + str(zwei)
+                self.set_value(*key, f"{eins} - {zwei}")
 
         return self
 
     def __sub__(self, other: Table) -> Table:
-        cpy = copy.deepcopy(self)
+        cpy = self.copy()
         cpy -= other
 
         return cpy
 
     def copy(self) -> Table:
-        return copy.deepcopy(self)
+        # copy the values as well so that copies don't share mutable cells,
+        # a deepcopy isn't needed as cells don't nest
+        new_table = self.__class__(self.num_rows, self.num_columns, name=self.name)
+        new_table.dct = {key: copy.copy(value) for key, value in self.dct.items()}
+
+        return new_table
 
     def set_value(self, column_no: int, row_no: int, value: Any) -> None:
         self.num_columns = max(column_no+1, self.num_columns)
         self.num_rows = max(row_no+1, self.num_rows)
-        key = self.str_encrypt(column_no, row_no)
-        self.dct[key] = value
+        self.dct[column_no, row_no] = value
 
     def insert_row(self, row: list[Any], row_no: int | None=None) -> None:
         if row_no is None:
@@ -156,37 +164,29 @@ class Table:
             self.set_value(i, row_no, el)
 
     def get(self, column_no: int, row_no: int) -> Any:
-        key = self.str_encrypt(column_no, row_no)
-        return self.dct.get(key, None)
+        return self.dct.get((column_no, row_no), None)
 
     def append_right(self, table: Table, space: int=0) -> None:
-        old_column_no = self.num_columns
-        
-        columns_to_add = table.num_columns
-        rows_to_add = table.num_rows
+        column_offset = self.num_columns + space
 
-        for row_no in range(rows_to_add):
-            for column_no in range(columns_to_add):
-                value = table.get(column_no, row_no)
-                if value is not None:
-                    self.set_value(old_column_no+column_no+space, row_no, value)
+        for (column_no, row_no), value in table.dct.items():
+            if value is not None:
+                self.set_value(column_offset+column_no, row_no, value)
 
     def append_bottom(self, table: Table, space: int=0) -> None:
-        total_rows = self.num_rows
-        for row_no in range(table.num_rows):
-            for column_no in range(table.num_columns):
-                value = table.get(column_no, row_no)
-                if value is not None:
-                    self.set_value(column_no, total_rows+row_no+space, value)
+        row_offset = self.num_rows + space
+
+        for (column_no, row_no), value in table.dct.items():
+            if value is not None:
+                self.set_value(column_no, row_offset+row_no, value)
 
     def get_ods_sheet(self, name: str=None) -> ezodf.Table:
         rows = max(1, self.num_rows)
         columns = max(1, self.num_columns)
         ods_sheet = ezodf.Table(size=(rows, columns))
-        for key in self.dct:
-            column, row = self.str_decrypt(key)
-            if self.dct[key] is not None:
-                ods_sheet[row, column].set_value(self.dct[key])
+        for (column, row), value in self.dct.items():
+            if value is not None:
+                ods_sheet[row, column].set_value(value)
 
         if name:
             ods_sheet.name = name
@@ -246,62 +246,43 @@ class Table:
         return table
 
     def get_markdown_table(self) -> str:
-        table = self.copy()
-        column_widths = []
-        num_columns = table.num_columns
-        num_rows = table.num_rows
+        num_columns = self.num_columns
         float_str = f"{{:.{self.format_float_digits}f}}"
 
-        for column_no in range(num_columns):
-            column_width = 0
-            for row_no in range(num_rows):
-                value = table[row_no, column_no]
-                if value is not None:
-                    if type(value) is float:
-                        str_value = float_str.format(value)
-                        table[row_no, column_no] = str_value
-                    else:
-                        str_value = str(value)
-                        table[row_no, column_no] = str_value
-                    
-                    column_width = max(column_width, len(str_value))
-                else:
-                    table[row_no, column_no] = ""
-            
-            column_widths.append(column_width)
-        
-        text = ""
-        for row_no in range(num_rows):
-            text += "|"
-            for column_no in range(num_columns):
-                width = column_widths[column_no]
-                value = table[row_no, column_no] or ""
+        cells = [[""] * num_columns for _ in range(self.num_rows)]
 
-                text += " " * (width - len(value) + 1)
-                text += value
-                text += " |"
-            
-            text += "\n"
+        for (column_no, row_no), value in self.dct.items():
+            if value is None:
+                continue
+
+            if type(value) is float:
+                cells[row_no][column_no] = float_str.format(value)
+            else:
+                cells[row_no][column_no] = str(value)
 
-        return text
+        column_widths = [max(len(value) for value in column) for column in zip(*cells)]
+
+        return "".join(
+            "|" + "".join(
+                " " * (width - len(value) + 1) + value + " |"
+                for width, value in zip(column_widths, row)
+            ) + "\n"
+            for row in cells
+        )
 
     def _repr_html_(self) -> str:
-        html = "<table><thead><td></td>"
-        for column_no in range(self.num_columns):
-            html += f"<td>{self.column_to_char(column_no + 1)}</td>"
-
-        html += "</thead>"
-        for row_no in range(self.num_rows):
-            html += f"<tr><td>{row_no+1}</td>"
-            for column_no in range(self.num_columns):
-                ident = self.str_encrypt(column_no, row_no)
-                value = self.dct.get(ident, "")
-                if isinstance(value, float):
-                    value = round(value, self.format_float_digits)
-                html += f"<td>{value}</td>"
-            html += "</tr>"
-
-        html += "</table>"
-
-        return html
+        column_headers = "".join(f"<td>{self.column_to_char(column_no + 1)}</td>" for column_no in range(self.num_columns))
+
+        cells = [["<td></td>"] * self.num_columns for _ in range(self.num_rows)]
+        for (column_no, row_no), value in self.dct.items():
+            if isinstance(value, float):
+                value = round(value, self.format_float_digits)
+            cells[row_no][column_no] = f"<td>{value}</td>"
+
+        rows = [
+            f"<tr><td>{row_no+1}</td>{''.join(row)}</tr>"
+            for row_no, row in enumerate(cells)
+        ]
+
+        return f"<table><thead><td></td>{column_headers}</thead>{''.join(rows)}</table>"
 
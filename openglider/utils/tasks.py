@@ -28,6 +28,8 @@ class Task:
     multiprocessed: bool = False
 
     parent: Task | None = None
+    # parent for which readiness was already confirmed (finished parents stay finished)
+    _ready_parent: Task | None = None
     start_time: float | None = None
     end_time: float | None = None
 
@@ -61,12 +63,17 @@ class Task:
     @property
     def is_ready(self) -> bool:
         if self.parent is not None:
+            if self._ready_parent is self.parent:
+                return True
+            
             if self.parent.failed:
                 self.failed = True
                 return False
             
             if not self.parent.finished:
                 return False
+            
+            self._ready_parent = self.parent
         
         return True
 
@@ -109,6 +116,8 @@ def run_task_async(jsondata: Any) -> Any:
     except Exception as e:
         with open("/home/simon/openglider/error_log", "w+") as outfile:
             outfile.write(str(e.args))
+        # let the queue mark the task as failed
+        raise
 
     return openglider.jsonify.dumps(task)
 
@@ -118,7 +127,7 @@ from concurrent.futures import ProcessPoolExecutor
 
 class TaskQueue:
     tasks: list[Task]
-    running = False
+    _running = False
     exception_hook: Callable | None = None
 
     def __init__(self, execute_function: Callable[[Any], Any]=None):
@@ -131,10 +140,26 @@ class TaskQueue:
             execute_function = asyncio.ensure_future
             
         self.execute = execute_function
-        asyncio.ensure_future(self.process())
+        # set whenever there might be new work for process()
+        self._wake = asyncio.Event()
+        self.process_task = asyncio.ensure_future(self.process())
+
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    @running.setter
+    def running(self, running: bool) -> None:
+        self._running = running
+        # let an idle process() loop notice
+        self._wake.set()
 
     def add(self, task: Task) -> None:
+        """
+        Add a task, always use this instead of appending to tasks directly (which doesn't wake up the queue)
+        """
         self.tasks.append(task)
+        self._wake.set()
     
     def is_busy(self) -> bool:
         for task in self.tasks:
@@ -147,35 +172,59 @@ class TaskQueue:
         for task in self.tasks:
             if task.running:
                 await task.stop()
+        
+        self.running = False
+    
+    async def _run_task(self, task: Task) -> None:
+        """
+        Run a single task, marks it as failed if it raises
+        """
+        try:
+            if task.multiprocessed:
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(self.pool, run_task_async, openglider.jsonify.dumps(task))
+                # the task ran on a copy in the other process
+                task.finished = True
+            else:
+                await task._run(self.execute)  # type: ignore
+        except Exception as e:
+            task.failed = True
+            if self.exception_hook:
+                self.exception_hook(*sys.exc_info())
+            else:
+                logger.error(f"task {task.get_name()} failed")
+                logger.error(e)
     
     async def process(self) -> None:
         self.running = True
+        # tasks that were started and did not finish yet
+        scheduled: dict[Task, asyncio.Task[None]] = {}
 
-        loop = asyncio.get_event_loop()
+        def on_done(task: Task, future: asyncio.Task[None]) -> None:
+            scheduled.pop(task, None)
+            # a finished task might have made its children ready
+            self._wake.set()
 
         while self.running:
-            for task in self.tasks:
-                if task.running:
-                    raise Exception(f"running task in queue! {task}")
+            self._wake.clear()
 
+            # every task has at most one parent, so a task with a finished parent
+            # doesn't have to wait for anything else and can be started right away.
+            # tasks with a failed parent fail as well, which might fail their children
+            failed = False
             for task in self.tasks:
-                if not any([task.finished, task.running, task.failed]):
-                    if task.is_ready:
-                        try:
-                            if task.multiprocessed:
-                                await loop.run_in_executor(self.pool, run_task_async, openglider.jsonify.dumps(task))
-                            else:
-                                await task._run(self.execute)  # type: ignore
-                        except Exception as e:
-                            task.failed = True
-                            if self.exception_hook:
-                                self.exception_hook(*sys.exc_info())
-                            else:
-                                logger.error("fuck")
-                                logger.error(e)
-
-            
-            await asyncio.sleep(1)
-        
-
-        
+                if task in scheduled or task.finished or task.running or task.failed:
+                    continue
+
+                if task.is_ready:
+                    scheduled[task] = asyncio.create_task(self._run_task(task))
+                    scheduled[task].add_done_callback(functools.partial(on_done, task))
+                elif task.failed:
+                    failed = True
+
+            # failed tasks might have failed their children -> only yield to the event loop
+            # and scan again, otherwise sleep until a task is added or a running task is done
+            if failed:
+                await asyncio.sleep(0)
+            else:
+                await self._wake.wait()
@@ -1,4 +1,6 @@
 from __future__ import annotations
+import functools
+import itertools
 import os
 import io
 import math
@@ -8,13 +10,21 @@ from collections.abc import Iterator, Sequence
 
 import ezdxf
 import ezdxf.document
+import ezdxf.entities
 import euklid
+import numpy as np
 import svgwrite
 import svgwrite.container
 import svgwrite.shapes
 import svglib.svglib
 from reportlab.graphics import renderPDF
 
+try:
+    # optional, renders pdfs much faster than svglib/reportlab
+    import cairosvg
+except (ImportError, OSError):  # OSError: cairo library not found
+    cairosvg = None
+
 from openglider.vector.drawing.part import PlotPart
 from openglider.utils.css import get_material_color, normalize_class_names
 from openglider.vector.text import Text
@@ -97,35 +107,44 @@ class Layout:
         self.parts = []
 
     def is_empty(self) -> bool:
-        if len(self.parts) == 0:
-            return True
-        
-        for part in self.parts:
-            for layer in part.layers.values():
-                for line in layer:
-                    if len(line) > 0:
-                        return False
-        
-        return True
+        return all(part.is_empty() for part in self.parts)
 
 
+    @classmethod
+    def _get_drawings(cls, parts: Sequence[PlotPart | Layout]) -> list[Layout]:
+        return [part if isinstance(part, Layout) else cls([part]) for part in parts]
+
+    @staticmethod
+    def _get_sizes(drawings: Sequence[Layout]) -> tuple[list[float], list[float]]:
+        """
+        widths and heights of all drawings, computed from one extrema array
+        """
+        if len(drawings) == 0:
+            return [], []
+
+        extrema = np.array([drawing._get_extrema() for drawing in drawings])
+        widths = np.abs(extrema[:, 2] - extrema[:, 0])
+        heights = np.abs(extrema[:, 3] - extrema[:, 1])
+
+        # empty parts have infinite extrema -> no size
+        widths[~np.isfinite(widths)] = 0.
+        heights[~np.isfinite(heights)] = 0.
+
+        return widths.tolist(), heights.tolist()
+
     @classmethod
     def stack_column(cls, parts: Sequence[PlotPart | Layout], distance: float, center_x: bool=True) -> Layout:
         column_dwg = cls()
         direction = (distance >= 0) - (distance < 0)
         y = 0.
-        widths = [part.width for part in parts]
+        drawings = cls._get_drawings(parts)
+        widths, heights = cls._get_sizes(drawings)
         max_width = max(widths + [0])
-        for width, part in zip(widths, parts):
-            if isinstance(part, Layout):
-                drawing = part
-            else:
-                drawing = cls([part])
-
+        for width, height, drawing in zip(widths, heights, drawings):
             x = (max_width - width)/2
             drawing.move_to(euklid.vector.Vector2D([x,y]))
 
-            y += direction * drawing.height
+            y += direction * height
             y += distance
 
             column_dwg.join(drawing)
@@ -139,20 +158,16 @@ class Layout:
         x = 0.
 
         # workaround: need proper fix
-        heights = [part.height for part in parts]
+        drawings = cls._get_drawings(parts)
+        widths, heights = cls._get_sizes(drawings)
         max_height = max(heights + [0])
 
-        for height, part in zip(heights, parts):
-            if isinstance(part, Layout):
-                drawing = part
-            else:
-                drawing = cls([part])
-
-            if drawing.width > 0 or drawing.height > 0:
+        for width, height, drawing in zip(widths, heights, drawings):
+            if width > 0 or height > 0:
                 y = (max_height - height)/2
                 drawing.move_to(euklid.vector.Vector2D([x,y]))
 
-                x += direction * drawing.width
+                x += direction * width
                 x += distance
 
                 row_dwg.join(drawing)
@@ -168,19 +183,17 @@ class Layout:
         heights = [0. for _ in range(rows)]
         widths = [0. for _ in range(columns)]
 
-        for row_no, row in enumerate(parts):
-            for column_no, part in enumerate(row):
-                widths[column_no] = max(widths[column_no], part.width)
-                heights[row_no] = max(heights[row_no], part.height)
+        drawings = [cls._get_drawings(row) for row in parts]
+
+        for row_no, row_drawings in enumerate(drawings):
+            for column_no, (width, height) in enumerate(zip(*cls._get_sizes(row_drawings))):
+                widths[column_no] = max(widths[column_no], width)
+                heights[row_no] = max(heights[row_no], height)
 
         y = 0.
-        for row_no, row in enumerate(parts):
+        for row_no, row_drawings in enumerate(drawings):
             x = 0.
-            for column_no, part in enumerate(row):
-                if isinstance(part, Layout):
-                    drawing = part
-                else:
-                    drawing = cls([part])
+            for column_no, drawing in enumerate(row_drawings):
                 drawing.move_to(euklid.vector.Vector2D([x, y]))
                 all_parts += drawing
                 x += widths[column_no]
@@ -209,7 +222,7 @@ class Layout:
                 grid.layers["grid"].append(line)
                 y += distance_y/2
 
-                all_parts.parts.append(grid)
+            all_parts.parts.append(grid)
 
         return all_parts
     
@@ -222,10 +235,9 @@ class Layout:
         :param text:
         :return:
         """
-        bbox = self.bbox[:]
-        p1, p2 = bbox[:2]
-        p1[1] -= distance
-        p2[1] -= distance
+        min_x, min_y, max_x, _ = self._get_extrema()
+        p1 = euklid.vector.Vector2D([min_x, min_y - distance])
+        p2 = euklid.vector.Vector2D([max_x, min_y - distance])
         data = []
         if text is not None:
             _text = Text(text, p1, p2, valign=-0.5, size=0.1)
@@ -239,20 +251,17 @@ class Layout:
     def draw_border(self, border: float=0.1, append: bool=True) -> PlotPart:
         if not self.parts:
             return PlotPart()
-        bbox = self.bbox[:]
-
-        bbox[0][0] -= border
-        bbox[0][1] -= border
-        bbox[1][0] += border
-        bbox[1][1] -= border
-        bbox[2][0] += border
-        bbox[2][1] += border
-        bbox[3][0] -= border
-        bbox[3][1] += border
+        min_x, min_y, max_x, max_y = self._get_extrema()
 
-        bbox.append(bbox[0])
+        corners = [
+            [min_x - border, min_y - border],
+            [max_x + border, min_y - border],
+            [max_x + border, max_y + border],
+            [min_x - border, max_y + border],
+            [min_x - border, min_y - border]
+        ]
 
-        data = [euklid.vector.PolyLine2D(bbox)]
+        data = [euklid.vector.PolyLine2D(corners)]
 
         border_part = PlotPart(drawing_boundary=data)
         if append:
@@ -327,22 +336,38 @@ class Layout:
             return 0
         return max([part.max_y for part in self.parts])
 
+    def _get_extrema(self) -> tuple[float, float, float, float]:
+        """
+        min_x, min_y, max_x, max_y with a single pass over the parts
+        """
+        if len(self.parts) == 0:
+            return 0, 0, 0, 0
+        
+        extrema = np.array([part.extrema for part in self.parts])
+        min_x, min_y = extrema[:, :2].min(axis=0).tolist()
+        max_x, max_y = extrema[:, 2:].max(axis=0).tolist()
+
+        return min_x, min_y, max_x, max_y
+
     @property
     def bbox(self) -> list[euklid.vector.Vector2D]:
-        return [euklid.vector.Vector2D([self.min_x, self.min_y]), euklid.vector.Vector2D([self.max_x, self.min_y]),
-                euklid.vector.Vector2D([self.max_x, self.max_y]), euklid.vector.Vector2D([self.min_x, self.max_y])]
+        min_x, min_y, max_x, max_y = self._get_extrema()
+        return [euklid.vector.Vector2D([min_x, min_y]), euklid.vector.Vector2D([max_x, min_y]),
+                euklid.vector.Vector2D([max_x, max_y]), euklid.vector.Vector2D([min_x, max_y])]
 
     @property
     def width(self) -> float:
         try:
-            return abs(self.max_x - self.min_x)
+            min_x, _, max_x, _ = self._get_extrema()
+            return abs(max_x - min_x)
         except ValueError:
             return 0.
 
     @property
     def height(self) -> float:
         try:
-            return abs(self.max_y - self.min_y)
+            _, min_y, _, max_y = self._get_extrema()
+            return abs(max_y - min_y)
         except ValueError:
             return 0.
 
@@ -351,7 +376,8 @@ class Layout:
             part.move(vector)
 
     def move_to(self, vector: euklid.vector.Vector2D) -> None:
-        diff = (euklid.vector.Vector2D(self.bbox[0]) - vector) * -1
+        min_x, min_y, _, _ = self._get_extrema()
+        diff = (euklid.vector.Vector2D([min_x, min_y]) - vector) * -1
         self.move(diff)
 
     def append_top(self, other: Layout, distance: float=0.) -> Layout:
@@ -397,7 +423,12 @@ class Layout:
 
             for entity in panel:  # type: ignore
                 layer = entity.dxf.layer
-                new_panel.layers[layer].append(euklid.vector.PolyLine2D([p[:2] for p in entity]))  # type: ignore
+                if isinstance(entity, ezdxf.entities.LWPolyline):
+                    # all points at once
+                    nodes = list(entity.get_points("xy"))
+                else:
+                    nodes = [p[:2] for p in entity]  # type: ignore
+                new_panel.layers[layer].append(euklid.vector.PolyLine2D(nodes))
 
         #blocks = list(dxf.blocks)
         blockrefs = dxf.modelspace().query("INSERT")
@@ -427,67 +458,109 @@ class Layout:
         #return blocks
         return dwg
 
-    def get_svg_group(self, config: dict[str, Any]=None, fill: bool=False) -> svgwrite.container.Group:
-        _config: dict[str, dict[str, Any]] = self.layer_config.copy()
-        if config is not None:
-            _config.update(config)
+    def get_svg_group(self, config: dict[str, Any]=None, fill: bool=False, inline_styles: bool=True) -> svgwrite.container.Group:
+        """
+        :param inline_styles: write the layer attributes to every polyline (True) or once into a <style> block using the layer classes (False, layers with whitespace in their name stay inline)
+        """
+        # _config is only read, no need to copy layer_config
+        _config: dict[str, dict[str, Any]] = self.layer_config if config is None else {**self.layer_config, **config}
+
+        # svg attributes per layer, prepared once for all parts
+        layer_attributes = {
+            layer_name: {key: value for key, value in layer_config.items() if key not in ("stroke-color", "visible")}
+            for layer_name, layer_config in _config.items()
+        }
+        default_attributes = {"stroke": "black", "fill": "none", "stroke-width": "0.25"}
+        material_colors: dict[str, str | None] = {}
+
+        def get_color(code: str) -> str | None:
+            if code not in material_colors:
+                material_colors[code] = get_material_color(code)
+            return material_colors[code]
 
         group = svgwrite.container.Group()
         group.scale(1, -1)  # svg coordinate system is x->right y->down
 
+        # css class -> attributes for the <style> block (inline_styles=False)
+        layer_styles: dict[str, dict[str, Any]] = {}
+
         for part in self.parts:
             part_group = svgwrite.container.Group()
-            part_layer_groups = {}
+
+            # a group per layer is only needed to separate several layers of a part
+            single_layer = sum(1 for layer in part.layers.values() if len(layer) > 0) <= 1
+
+            material_classes = ""
+            if part.material_code:
+                material_classes = f" {normalize_class_names(part.material_code)} {part.material_code}"
 
             for layer_name in part.layers:
-                # todo: simplify
-                if layer_name in _config:
-                    layer_config = _config[layer_name].copy()
-                    for key in ("stroke-color", "visible"):
-                        if key in layer_config:
-                            layer_config.pop(key)
-                else:
-                    layer_config = {"stroke": "black", "fill": "none", "stroke-width": "0.25"}
+                lines = part.layers[layer_name]
+                layer_config = layer_attributes.get(layer_name, default_attributes)
+                color = None
+
+                # a class name with whitespace is several classes and can't be used as a selector
+                layer_class = normalize_class_names(layer_name)
+                use_style_block = not inline_styles and not any(char.isspace() for char in layer_class)
 
                 if fill:
-                    color = get_material_color(layer_name)
+                    color = get_color(layer_name)
 
                     if color is None:
-                        color = get_material_color(part.material_code)
+                        color = get_color(part.material_code)
                         
-                    if color:
+                    if color and not use_style_block:
+                        layer_config = layer_config.copy()
                         layer_config["fill"] = color
 
-                lines = part.layers[layer_name]
-
-                if layer_name not in part_layer_groups:
+                if single_layer or len(lines) == 0:
+                    part_layer_group = part_group
+                else:
                     part_layer_group = svgwrite.container.Group()
-                    #group.elementname = layer_name
                     part_group.add(part_layer_group)
-                    part_layer_groups[layer_name] = part_layer_group
-                else:
-                    part_layer_group = part_layer_groups[layer_name]
 
-                for line in lines:
-                    element = svgwrite.shapes.Polyline(line, **layer_config)
-                    classes = [layer_name]
-                    if part.material_code:
-                        classes.append(normalize_class_names(part.material_code))
-                        classes.append(part.material_code)
-                    element.attribs["class"] = " ".join(classes)
-                    part_layer_group.add(element)
+                # debug=False: skip svgwrite's validation of every coordinate (done twice: on creation and serialization)
+                if not use_style_block:
+                    class_names = layer_name + material_classes
+
+                    for line in lines:
+                        element = svgwrite.shapes.Polyline(line.tolist(), debug=False, **layer_config)
+                        element.attribs["class"] = class_names
+                        part_layer_group.add(element)
+                elif len(lines) > 0:
+                    layer_styles[layer_class] = layer_config
+                    class_names = layer_class + material_classes
+
+                    for line in lines:
+                        element = svgwrite.shapes.Polyline(line.tolist(), debug=False)
+                        element.attribs["class"] = class_names
+                        if color:
+                            # inline style: a presentation attribute would lose against the class rule
+                            element.attribs["style"] = f"fill: {color}"
+                        part_layer_group.add(element)
 
             group.add(part_group)
 
+        if layer_styles:
+            style = svgwrite.container.Style()
+            for css_class, attributes in layer_styles.items():
+                # "id" is an element attribute, not a css property
+                rules = " ".join(f"{key}: {value};" for key, value in attributes.items() if key != "id")
+                style.append(f".{css_class} {{ {rules} }}\n")
+            group.add(style)
+
         return group
 
-    def get_svg_drawing(self, unit: str="mm", border: float=0.02, fill: bool=False) -> svgwrite.Drawing:
-        border_w, border_h = (2*border*x for x in (self.width, self.height))
-        width, height = self.width+border_w, self.height+border_h
+    def get_svg_drawing(self, unit: str="mm", border: float=0.02, fill: bool=False, inline_styles: bool=True) -> svgwrite.Drawing:
+        min_x, min_y, max_x, max_y = self._get_extrema()
+        layout_width, layout_height = abs(max_x - min_x), abs(max_y - min_y)
+
+        border_w, border_h = (2*border*x for x in (layout_width, layout_height))
+        width, height = layout_width+border_w, layout_height+border_h
 
         drawing = svgwrite.Drawing(size=[("{}"+unit).format(n) for n in (width, height)])
-        drawing.viewbox(self.min_x-border_w/2, -self.max_y-border_h/2, width, height)
-        group = self.get_svg_group(fill=fill)
+        drawing.viewbox(min_x-border_w/2, -max_y-border_h/2, width, height)
+        group = self.get_svg_group(fill=fill, inline_styles=inline_styles)
         drawing.add(group)
 
         return drawing
@@ -497,25 +570,27 @@ class Layout:
         style = svgwrite.container.Style()
         styles = {}
 
-        # recursive
-        def add_style(elem: svgwrite.Drawing) -> None:
+        # the same class names repeat on most elements
+        normalize = functools.lru_cache(maxsize=1024)(normalize_class_names)
+        get_color = functools.lru_cache(maxsize=1024)(get_material_color)
+
+        # depth-first walk (same order as a recursion) without the recursion limit
+        stack = [drawing]
+        while stack:
+            elem = stack.pop()
             classes = elem.attribs.get("class", "")
-            normalized = normalize_class_names(classes)
+            normalized = normalize(classes)
 
             if normalized:
-                elem.attribs["class"] = normalize_class_names(classes)
+                elem.attribs["class"] = normalized
 
             for _class in classes.split(" "):
-                colour = get_material_color(_class)
-                _class_new = normalize_class_names(_class)
+                colour = get_color(_class)
 
                 if colour:
-                    styles[_class_new] = [f"fill: {colour}"]
-            if hasattr(elem, "elements"):
-                for sub_elem in elem.elements:
-                    add_style(sub_elem)
+                    styles[normalize(_class)] = [f"fill: {colour}"]
 
-        add_style(drawing)
+            stack.extend(reversed(getattr(elem, "elements", [])))
 
         for css_class, attribs in styles.items():
             style.append(f".{css_class} {{\n")
@@ -530,7 +605,8 @@ class Layout:
 
     def _repr_svg_(self) -> str:
         width = 800
-        height = int(width * self.height/self.width)+1
+        min_x, min_y, max_x, max_y = self._get_extrema()
+        height = int(width * abs(max_y - min_y)/abs(max_x - min_x))+1
         drawing = self.get_svg_drawing()
         self.add_svg_styles(drawing)
         drawing["width"] = f"{width}px"
@@ -540,8 +616,8 @@ class Layout:
 
         return drawing.tostring()
 
-    def export_svg(self, path: str | os.PathLike, add_styles: bool=False, fill: bool=False) -> None:
-        drawing = self.get_svg_drawing(fill=fill)
+    def export_svg(self, path: str | os.PathLike, add_styles: bool=False, fill: bool=False, inline_styles: bool=True) -> None:
+        drawing = self.get_svg_drawing(fill=fill, inline_styles=inline_styles)
 
         if add_styles:
             self.add_svg_styles(drawing)
@@ -552,39 +628,44 @@ class Layout:
     def export_dxf(self, path: str | Path, dxfversion: str="AC1015") -> ezdxf.document.Drawing:
         drawing = ezdxf.new(dxfversion=dxfversion)
 
-        drawing.header["$EXTMAX"] = (self.max_x, self.max_y, 0)
-        drawing.header["$EXTMIN"] = (self.min_x, self.min_y, 0)
+        min_x, min_y, max_x, max_y = self._get_extrema()
+        drawing.header["$EXTMAX"] = (max_x, max_y, 0)
+        drawing.header["$EXTMIN"] = (min_x, min_y, 0)
         ms = drawing.modelspace()
 
         for part in self.parts:
             group = drawing.groups.new()
+            entities: list[ezdxf.entities.DXFGraphic] = []
+
+            for layer_name, layer in part.layers.items():
+                if layer_name not in drawing.layers:
+                    attributes = layer._get_dxf_attributes()
+                    dwg_layer = drawing.layers.new(name=layer_name, dxfattribs=attributes)
+                    if not layer.visible:
+                        dwg_layer.off()
+
+                dxfattribs = {"layer": layer_name}
+
+                for elem in layer:
+                    nodes = elem.tolist()
+                    if len(nodes) == 1:
+                        for node in nodes:
+                            if self.point_width is None:
+                                entities.append(ms.add_point(node, dxfattribs=dxfattribs))
+                            else:
+                                x, y = node
+                                entities.append(
+                                    ms.add_lwpolyline([[x-self.point_width/2, y], [x+self.point_width/2, y]])
+                                )
+                    else:
+                        dxf_obj = ms.add_lwpolyline(nodes, dxfattribs=dxfattribs)
+                        if len(nodes) > 2 and nodes[0] == nodes[-1]:
+                            dxf_obj.closed = True
+                        entities.append(dxf_obj)
+
             part_group: Any
             with group.edit_data() as part_group:
-                for layer_name, layer in part.layers.items():
-                    if layer_name not in drawing.layers:
-                        attributes = layer._get_dxf_attributes()
-                        dwg_layer = drawing.layers.new(name=layer_name, dxfattribs=attributes)
-                        if not layer.visible:
-                            dwg_layer.off()
-
-                    for elem in layer:
-                        dxfattribs = {"layer": layer_name}
-                        if len(elem) == 1:
-                            for node in elem:
-                                if self.point_width is None:
-                                    part_group.append(
-                                        ms.add_point(node, dxfattribs=dxfattribs)
-                                    )
-                                else:
-                                    x, y = node
-                                    part_group.append(
-                                        ms.add_lwpolyline([[x-self.point_width/2, y], [x+self.point_width/2, y]])
-                                    )
-                        else:
-                            dxf_obj = ms.add_lwpolyline(elem.tolist(), dxfattribs=dxfattribs)
-                            if len(elem) > 2 and all([elem.get(len(elem)-1)[i] == elem.get(0)[i] for i in range(2)]):
-                                dxf_obj.closed = True
-                            part_group.append(dxf_obj)
+                part_group.extend(entities)
 
         drawing.saveas(path)
         return drawing
@@ -600,44 +681,52 @@ class Layout:
 
         def format_line(line: euklid.vector.PolyLine2D) -> str:
             a = f"\nA {len(line)} "
-            b = " ".join([f"({p[0]:.5f},{p[1]:.5f})" for p in line])
+            # format all coordinates with a single %-operation
+            coordinates = tuple(itertools.chain.from_iterable(line.tolist()))
+            b = " ".join(["(%.5f,%.5f)"] * len(line)) % coordinates
             return a+b
 
+        # collect everything and write the file at once
+        output: list[str] = []
+
+        # head
+        output.append(f"A {len(filename)} {filename} 1 1 0 0 0 0\n")
+        for part in self.parts:
+            # part-header: 1A {name}, {position_x} {pos_y} {rot_degrees} {!derivePerimeter} {useAngle} {flipped}
+            part_header = "\n1A {len_name} {name} ({pos_x}, {pos_y}) {rotation_deg} 0 0 0 0 0"
+            name = part.name or "unnamed"
+            args = {"len_name": len(name),
+                    "name": name,
+                    "pos_x": 0,
+                    "pos_y": 0,
+                    "rotation_deg": 0}
+            output.append(part_header.format(**args))
+
+            for plottype in self.ntv_layer_config:
+                for layer_origin in self.ntv_layer_config[plottype]:
+                    for line in part.layers[layer_origin]:
+                        # line-header type: (R->ignore, P->plot, C->cut
+                        output.append(f"\n1A P 0 {plottype} 0 0 0")
+                        output.append(format_line(line))
+
+
+            # part-end
+            output.append("\n0\n")
+
+
+        # end
+        output.append("\n0")
+
         with open(path, "w") as outfile:
-            # head
-            outfile.write(f"A {len(filename)} {filename} 1 1 0 0 0 0\n")
-            for part in self.parts:
-                # part-header: 1A {name}, {position_x} {pos_y} {rot_degrees} {!derivePerimeter} {useAngle} {flipped}
-                part_header = "\n1A {len_name} {name} ({pos_x}, {pos_y}) {rotation_deg} 0 0 0 0 0"
-                name = part.name or "unnamed"
-                args = {"len_name": len(name),
-                        "name": name,
-                        "pos_x": 0,
-                        "pos_y": 0,
-                        "rotation_deg": 0}
-                outfile.write(part_header.format(**args))
-
-                # part-boundary
-                part_boundary = "\n{boundary_len} {line}"
-                #outfile.write()
-
-                for plottype in self.ntv_layer_config:
-                    for layer_origin in self.ntv_layer_config[plottype]:
-                        for line in part.layers[layer_origin]:
-                            # line-header type: (R->ignore, P->plot, C->cut
-                            outfile.write(f"\n1A P 0 {plottype} 0 0 0")
-                            outfile.write(format_line(line))
-
-
-                # part-end
-                outfile.write("\n0\n")
-
-
-            # end
-            outfile.write("\n0")
+            outfile.write("".join(output))
             
     def export_pdf(self, path: str | os.PathLike, fill: bool=False) -> None:
         dwg = self.get_svg_drawing(fill=fill).tostring().encode("utf-8")
+
+        if cairosvg is not None:
+            cairosvg.svg2pdf(bytestring=dwg, write_to=str(path))
+            return
+
         with io.BytesIO(dwg) as fp:
             report = svglib.svglib.svg2rlg(fp)
             renderPDF.drawToFile(report, str(path))
@@ -165,6 +165,9 @@ class PlotPart:
     def copy(self) -> PlotPart:
         return copy.deepcopy(self)
 
+    def is_empty(self) -> bool:
+        return not any(len(line) > 0 for layer in self.layers.values() for line in layer)
+
     def mirror(self, p1: euklid.vector.Vector2D, p2: euklid.vector.Vector2D) -> PlotPart:
         layers = {}
 
@@ -175,23 +178,40 @@ class PlotPart:
         return PlotPart(**layers, material_code=self.material_code, name=self.name)
 
 
+    @staticmethod
+    def _get_nodes(layers: Iterator[Layer] | list[Layer]) -> np.ndarray:
+        node_lists = [line.tolist() for layer in layers for line in layer if line]
+
+        if not node_lists:
+            return np.zeros((0, 2))
+
+        return np.concatenate([np.asarray(nodes, dtype=float) for nodes in node_lists])
+
     def max_function(self, axis: int, layer: Layer) -> float:
-        start = float("-Inf")
-        if layer:
-            for line in layer:
-                if line:
-                    values = [p[axis] for p in line]
-                    start = max(start, max(values))
-        return start
+        nodes = self._get_nodes([layer])
+        if len(nodes) == 0:
+            return float("-Inf")
+        return float(nodes[:, axis].max())
 
     def min_function(self, axis: int, layer: Layer) -> float:
-        start = float("Inf")
-        if layer:
-            for line in layer:
-                if line:
-                    values = [p[axis] for p in line]
-                    start = min(start, min(values))
-        return start
+        nodes = self._get_nodes([layer])
+        if len(nodes) == 0:
+            return float("Inf")
+        return float(nodes[:, axis].min())
+
+    @property
+    def extrema(self) -> tuple[float, float, float, float]:
+        """
+        min_x, min_y, max_x, max_y of all layers with a single pass over the nodes
+        """
+        nodes = self._get_nodes(self.layers.values())
+        if len(nodes) == 0:
+            return float("Inf"), float("Inf"), float("-Inf"), float("-Inf")
+
+        min_x, min_y = nodes.min(axis=0).tolist()
+        max_x, max_y = nodes.max(axis=0).tolist()
+
+        return min_x, min_y, max_x, max_y
 
     @property
     def max_x(self) -> float:
@@ -221,11 +241,13 @@ class PlotPart:
 
     @property
     def width(self) -> float:
-        return self.max_x - self.min_x
+        min_x, _, max_x, _ = self.extrema
+        return max_x - min_x
 
     @property
     def height(self) -> float:
-        return self.max_y - self.min_y
+        _, min_y, _, max_y = self.extrema
+        return max_y - min_y
 
     @property
     def bbox(self) -> tuple[
@@ -234,8 +256,9 @@ class PlotPart:
         tuple[float, float],
         tuple[float, float]
     ]:
-        return ((self.min_x, self.min_y), (self.max_x, self.min_y),
-                (self.max_x, self.max_y), (self.min_x, self.max_y))
+        min_x, min_y, max_x, max_y = self.extrema
+        return ((min_x, min_y), (max_x, min_y),
+                (max_x, max_y), (min_x, max_y))
 
     def rotate(self, angle: float, radians: bool=True) -> None:
         if not radians:
@@ -27,10 +27,9 @@ class CirclePart:
         l1 = p2 - p1
         l2 = p3 - p2
 
-        rotation = euklid.vector.Rotation2D(-math.pi/2)
-
-        n1 = rotation.apply(l1)
-        n2 = rotation.apply(l2)
+        # normals (rotated by -90°)
+        n1 = V2([l1[1], -l1[0]])
+        n2 = V2([l2[1], -l2[0]])
 
         p12 = (p1 + p2)/2
         p23 = (p2 + p3)/2
@@ -49,14 +48,18 @@ class CirclePart:
         return cls(p1, p3, p2)
     
     def get_sequence(self, num: int=20) -> euklid.vector.PolyLine2D:
-        lst = []
-
         end = self.r.angle() - (self.p3-self.center).angle()
-        
-        for angle in numpy.linspace(0, end, num):
-            lst.append(self.center + euklid.vector.Rotation2D(-angle).apply(self.r))
+        angles = numpy.linspace(0, end, num)
+        cos, sin = numpy.cos(angles), numpy.sin(angles)
+
+        # rotate r by -angle for all angles at once
+        r_x, r_y = self.r
+        points = numpy.empty((num, 2))
+        points[:, 0] = r_x * cos + r_y * sin
+        points[:, 1] = r_y * cos - r_x * sin
+        points += list(self.center)
 
-        return euklid.vector.PolyLine2D(lst)
+        return euklid.vector.PolyLine2D(points.tolist())
 
     def _repr_svg_(self) -> str:
 
@@ -83,17 +86,18 @@ class Ellipse:
         self.rotation = rotation
 
     def get_sequence(self, num: int=20) -> euklid.vector.PolyLine2D:
-        points = []
+        angles = numpy.linspace(0, 2*math.pi, num)
 
-        for i in range(num):
-            angle = math.pi * 2 * (i/(num-1))
-            diff = euklid.vector.Vector2D([math.cos(angle), self.height*math.sin(angle)]) * self.radius
-            
-            points.append(self.center + diff)
+        points = numpy.empty((num, 2))
+        points[:, 0] = numpy.cos(angles)
+        points[:, 1] = self.height * numpy.sin(angles)
 
-        line = euklid.vector.PolyLine2D(points)
+        # scale, rotate and move in one go instead of rotating the PolyLine2D afterwards
+        cos, sin = math.cos(self.rotation), math.sin(self.rotation)
+        transformation = numpy.array([[cos, sin], [-sin, cos]]) * self.radius
+        points = points @ transformation + list(self.center)
 
-        return line.rotate(self.rotation, self.center)
+        return euklid.vector.PolyLine2D(points.tolist())
 
     @classmethod
     def from_center_p2(cls, center: V2, p2: V2, aspect_ratio: float=1.) -> Ellipse:
@@ -1,3 +1,4 @@
+import functools
 import logging
 import math
 import operator
@@ -6,49 +7,81 @@ from typing import Any, ClassVar, Self, TypeVar
 from collections.abc import Callable
 
 import pydantic
+import pydantic_core
 
 logger = logging.Logger(__name__)
 OpReturnType = TypeVar("OpReturnType")
 
-#@dataclass(frozen=True, init=False)
-class Quantity(pydantic.BaseModel):
-    model_config = pydantic.ConfigDict(
-        frozen=True,
-        extra="forbid"
-    )
-    __pydantic_custom_init__ = True
+class Quantity:
+    """
+    Immutable value (si unit) with an optional unit for display.
+    Validates as a field of pydantic models from numbers, strings ("2.5mm") and dicts.
+    """
+    __slots__ = ("value", "display_unit", "_repr")
+
     value: float
+    display_unit: str | None
+    _repr: str  # set on first use
 
     unit: ClassVar[str]
     unit_variants: ClassVar[dict[str, float]]
-    display_unit: str | None = None
+    default_display_unit: ClassVar[str | None] = None
 
     re_number: ClassVar[str] = r"[+-]?(?:(?:\d+\.?\d*)|(?:\.\d+))(?:[eE][+-]?\d+)?|\d+"
     re_unit: ClassVar[str] = r"[\w°%]+)(?!\S"
-    re_number_only: ClassVar[re.Pattern] = re.compile(f"^\s*({re_number})\s*$")
-    re_combined: ClassVar[re.Pattern] = re.compile(f"({re_number})\s*({re_unit})")
+    # number with an optional unit: "2.5", "2.5mm", "2.5 mm"
+    re_combined: ClassVar[re.Pattern] = re.compile(rf"^\s*(?P<value>{re_number})\s*(?:(?P<unit>{re_unit})|$)")
 
     def __init__(self, value: float | str, unit: str | None=None, display_unit: str | None=None):
         data = self._get_init_args(value, unit, display_unit)
-        super().__init__(**data)
+        object.__setattr__(self, "value", data["value"])
+        object.__setattr__(self, "display_unit", data.get("display_unit", self.default_display_unit))
+
+    @classmethod
+    def _construct(cls, value: float, display_unit: str | None) -> Self:
+        """
+        New instance from a computed si value, skipping validation
+        """
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", float(value))
+        # same as the constructor: fall back to the default display_unit
+        object.__setattr__(instance, "display_unit", display_unit or cls.default_display_unit)
+        return instance
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickle / copy without __setattr__
+        return self.__class__._construct, (self.value, self.display_unit)
 
     @classmethod
     def zero(cls) -> Self:
         return cls(0.)
     
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse(cls, value: str) -> tuple[float, str | None]:
+        """
+        Parse "{number}{unit}" (cached, config files repeat the same strings a lot)
+        """
+        if match := cls.re_combined.match(value):
+            return float(match["value"]), match["unit"]
+        
+        return float(value), None
+    
     @classmethod
     def _get_init_args(cls, value: float | str, unit: str | None=None, display_unit: str | None=None) -> dict[str, Any]:
-        value_float = None
         if isinstance(value, str):
-            if cls.re_number_only.match(value):
-                value_float = float(value)
-            else:
+            value_float, value_unit = cls._parse(value)
+
+            if value_unit is not None:
                 assert unit is None
-                if match := cls.re_combined.match(value):
-                    value_str, unit = match.groups()
-                    value_float = float(value_str)
-        
-        if value_float is None:
+                unit = value_unit
+        else:
             value_float = float(value)
 
         factor = 1.
@@ -102,9 +135,17 @@ class Quantity(pydantic.BaseModel):
         return repr(self)
     
     def __repr__(self) -> str:
+        # instances are immutable: format once
+        try:
+            return self._repr
+        except AttributeError:
+            pass
+
         value, unit = self._get_display_value()
+        text = f"{value}{unit}"
+        object.__setattr__(self, "_repr", text)
 
-        return f"{value}{unit}"
+        return text
         
     def __format__(self, spec: str) -> str:
         value, unit = self._get_display_value()
@@ -127,14 +168,10 @@ class Quantity(pydantic.BaseModel):
         else:
             raise ValueError(f"cannot do '{operator}' with {self.unit} and {type(other)}")
         
-        return self.__class__(
-            value=new_value,
-            display_unit=display_unit
-        )
+        return self._construct(new_value, display_unit)
     
     def __str__(self) -> str:
-        value, unit = self._get_display_value()
-        return f"{value}{unit}"
+        return self.__repr__()
     
     def __apply_cmp(self, other: Any, operator: Callable[[float, float], OpReturnType]) -> OpReturnType:
         if isinstance(other, self.__class__):
@@ -168,7 +205,7 @@ class Quantity(pydantic.BaseModel):
         return self.__apply_operator(other, operator.truediv)
     
     def __neg__(self) -> Self:
-        return self.__apply_operator(-1, operator.mul)
+        return self._construct(-self.value, self.display_unit)
     
     def __gt__(self, other: Any) -> bool:
         return self.__apply_cmp(other, operator.gt)
@@ -192,24 +229,61 @@ class Quantity(pydantic.BaseModel):
     def si(self) -> float:
         return self.value
     
-    @pydantic.model_validator(mode="before")
     @classmethod
-    def _validate(cls, v: Any) -> dict[str, Any] | Self:
-        if isinstance(v, (str, float, int)):
-            return cls._get_init_args(value=v)
-        elif isinstance(v, cls):
+    def _validate(cls, v: Any) -> Self:
+        # cheapest checks first: instances pass through, numbers need no parsing
+        if isinstance(v, cls):
             if v.unit == cls.unit:
                 return v
+        elif isinstance(v, (float, int)):
+            return cls._construct(v, None)
+        elif isinstance(v, str):
+            return cls(v)
         elif isinstance(v, dict):
-            return v
+            try:
+                return cls(**v)
+            except TypeError as e:
+                raise ValueError(f"Invalid value for {cls}: {v}") from e
 
         raise ValueError(f"Invalid value for {cls}: {v}")
     
+    def _serialize(self) -> dict[str, Any]:
+        return {
+            "value": self.value,
+            "display_unit": self.display_unit
+        }
+    
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source_type: Any, handler: pydantic.GetCoreSchemaHandler) -> pydantic_core.CoreSchema:
+        return pydantic_core.core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=pydantic_core.core_schema.plain_serializer_function_ser_schema(cls._serialize)
+        )
+    
+    @classmethod
+    def __get_pydantic_json_schema__(cls, core_schema: pydantic_core.CoreSchema, handler: pydantic.GetJsonSchemaHandler) -> dict[str, Any]:
+        # same as the serialized form
+        return {
+            "title": cls.__name__,
+            "type": "object",
+            "properties": {
+                "value": {"title": "Value", "type": "number"},
+                "display_unit": {
+                    "title": "Display Unit",
+                    "anyOf": [{"type": "string"}, {"type": "null"}],
+                    "default": cls.default_display_unit
+                },
+            },
+            "required": ["value"],
+        }
+    
     @classmethod
     def get_regex(cls) -> str:
         return cls.re_number
 
 class Length(Quantity):
+    __slots__ = ()
+
     def __init__(self, value: float | str, unit: str | None=None, display_unit: str | None=None):
         super().__init__(value, unit, display_unit)
 
@@ -221,6 +295,8 @@ class Length(Quantity):
     }
 
 class Percentage(Quantity):
+    __slots__ = ()
+
     def __init__(self, value: float | str, unit: str | None=None, display_unit: str | None=None):
         super().__init__(value, unit, display_unit)
 
@@ -228,9 +304,11 @@ class Percentage(Quantity):
     unit_variants = {
         "%": 0.01,
     }
-    display_unit: str = "%"
+    default_display_unit = "%"
 
 class Angle(Quantity):
+    __slots__ = ()
+
     def __init__(self, value: float | str, unit: str | None=None, display_unit: str | None=None):
         super().__init__(value, unit, display_unit)
 
@@ -239,7 +317,7 @@ class Angle(Quantity):
         "deg": math.pi/180,
         "°": math.pi/180,
     }
-    display_unit: str = "°"
+    default_display_unit = "°"
 
 a=Quantity(2)
 b=Length(2)
\ No newline at end of file